@@ -5,10 +5,25 @@ Common functions for SSH and Vast.ai integration.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
+import shutil
 import subprocess
+import time
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import Any, Iterator, TypedDict, cast
+
+try:
+    import msgspec
+except ImportError:  # optional; stdlib json is the fallback
+    msgspec = None
+
+_JSON_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if msgspec is not None:
+    _JSON_ERRORS += (msgspec.DecodeError,)
 
 
 class VastPort(TypedDict):
@@ -21,6 +36,38 @@ class VastInstance(TypedDict):
     ports: dict[str, list[VastPort]]
 
 
+# Only the directives we use; everything else is skipped inside the regex engine
+_DIRECTIVE_RE = re.compile(
+    r"^[ \t]*(Host|HostName|Port|User|IdentityFile)[ \t]+(\S+)", re.MULTILINE
+)
+_KEY_MAP = {
+    "HostName": "hostname",
+    "Port": "port",
+    "User": "user",
+    "IdentityFile": "identity",
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path: str, mtime: int) -> dict[str, dict[str, str]]:
+    """Parse every Host block in one pass; cached until the file's mtime changes"""
+    text = Path(path).read_text(encoding="utf-8")
+    hosts: dict[str, dict[str, str]] = {}
+    host_config: dict[str, str] | None = None
+
+    for match in _DIRECTIVE_RE.finditer(text):
+        key, value = match.groups()
+        if key == "Host":
+            host_config = hosts.setdefault(value, {})
+        elif host_config is not None:
+            field = _KEY_MAP[key]
+            if field == "identity":
+                value = str(Path(value).expanduser())
+            host_config.setdefault(field, value)
+
+    return hosts
+
+
 class SSHConfig:
     """Parse SSH config to get connection details"""
 
@@ -31,37 +78,18 @@ class SSHConfig:
         self.config_path = Path(config_path).expanduser()
         self.host_info = {}
 
-    def get_host_info(self, host: str = "vast-ai") -> dict[str, str]:
-        """Extract host, port, user, and identity file from SSH config"""
+    def _parsed(self) -> dict[str, dict[str, str]]:
+        """Return the parsed host map, re-reading only when the file changes"""
         if not self.config_path.exists():
             raise FileNotFoundError(f"SSH config not found at {self.config_path}")
+        mtime = self.config_path.stat().st_mtime_ns
+        return _parse_config(str(self.config_path), mtime)
 
-        current_host: str | None = None
-        host_config: dict[str, str] = {}
-
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-
-                if line.startswith("Host "):
-                    if current_host == host and host_config:
-                        return host_config
-                    current_host = line.split()[1]
-                    host_config = {}
-
-                elif current_host == host:
-                    if line.startswith("HostName "):
-                        host_config["hostname"] = line.split()[1]
-                    elif line.startswith("Port "):
-                        host_config["port"] = line.split()[1]
-                    elif line.startswith("User "):
-                        host_config["user"] = line.split()[1]
-                    elif line.startswith("IdentityFile "):
-                        identity = line.split()[1]
-                        host_config["identity"] = str(Path(identity).expanduser())
-
-        if current_host == host and host_config:
-            return host_config
+    def get_host_info(self, host: str = "vast-ai") -> dict[str, str]:
+        """Extract host, port, user, and identity file from SSH config"""
+        host_config = self._parsed().get(host)
+        if host_config:
+            return dict(host_config)
 
         raise ValueError(f"Host '{host}' not found in SSH config")
 
@@ -69,21 +97,176 @@ class SSHConfig:
         """List host aliases from SSH config"""
         if not self.config_path.exists():
             return []
-        hosts: list[str] = []
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("Host "):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        name = parts[1]
-                        if name.startswith("git") or name.startswith("github"):
-                            continue
-                        hosts.append(name)
-        return hosts
+        return [
+            name
+            for name in self._parsed()
+            if not (name.startswith("git") or name.startswith("github"))
+        ]
 
 
-def _load_vast_instance_for_host(hostname: str) -> VastInstance | None:
+def _is_excluded(name: str, exclude: list[str]) -> bool:
+    return any(fnmatch(name, pattern.rstrip("/")) for pattern in exclude)
+
+
+def _scan_tree(
+    root: Path, rel: str, exclude: list[str], errors: list[str] | None = None
+) -> Iterator[tuple[str, int]]:
+    """Yield (path relative to root's parent, size) for everything under root
+
+    Uses os.scandir so directory/file type comes from the dirent itself; only
+    regular entries are stat'ed, for their size. Directories are yielded
+    (size 0) so empty ones are recreated remotely. Like rsync, folders and
+    entries that vanish or can't be read are skipped; each is described in
+    `errors` when given, so the caller can report a partial transfer.
+    """
+    stack = [(str(root), rel)]
+    while stack:
+        dir_path, dir_rel = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if _is_excluded(entry.name, exclude):
+                        continue
+                    entry_rel = f"{dir_rel}/{entry.name}" if dir_rel else entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        size = (
+                            0 if is_dir else entry.stat(follow_symlinks=False).st_size
+                        )
+                    except OSError as e:
+                        if errors is not None:
+                            errors.append(f"{entry.path}: {e.strerror}")
+                        continue
+                    yield entry_rel, size
+                    if is_dir:
+                        stack.append((entry.path, entry_rel))
+        except OSError as e:
+            if errors is not None:
+                errors.append(f"{dir_path}: {e.strerror}")
+
+
+# Already-compressed payloads: rsync -z would only burn CPU on these
+_SKIP_EXT = (
+    "png jpg jpeg webp gif mp4 mkv avi mov mp3 flac zip 7z "
+    "zst xz gz bz2 lz4 br parquet safetensors pt ckpt"
+).split()
+# rsync separates --skip-compress suffixes with "/"
+_SKIP_COMPRESS = "--skip-compress=" + "/".join(_SKIP_EXT)
+
+
+@functools.cache
+def _which(tool: str) -> str | None:
+    """Resolve an executable on PATH once per process"""
+    return shutil.which(tool)
+
+
+_AES_CIPHERS = ("aes128-gcm@openssh.com", "aes256-gcm@openssh.com")
+_CHACHA_CIPHERS = ("chacha20-poly1305-mt@hpnssh.org", "chacha20-poly1305@openssh.com")
+
+
+@functools.cache
+def _ssh_query(ssh_bin: str, what: str) -> frozenset[str]:
+    """Return the algorithm names an ssh binary reports for `-Q <what>`"""
+    try:
+        result = subprocess.run(
+            [ssh_bin, "-Q", what], capture_output=True, text=True, check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return frozenset()
+    return frozenset(result.stdout.split())
+
+
+@functools.cache
+def _is_hpn_ssh(ssh_bin: str) -> bool:
+    """True when `ssh -V` identifies the binary as an HPN-SSH build"""
+    try:
+        result = subprocess.run([ssh_bin, "-V"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return False
+    return "hpn" in (result.stderr + result.stdout).lower()
+
+
+def _none_cipher_options(ssh_bin: str) -> list[str]:
+    """HPN-SSH options that drop to the NONE cipher after authentication
+
+    Empty when `ssh_bin` isn't HPN-SSH. A multiplexed session rides its
+    master's connection and cipher, so NONE-cipher sessions never use a
+    ControlMaster: each opens its own connection, and the shared masters
+    (and everything multiplexed over them) always stay encrypted.
+    """
+    if not _is_hpn_ssh(ssh_bin):
+        return []
+    return ["-o", "NoneEnabled=yes", "-o", "NoneSwitch=yes"]
+
+
+def _hpn_window_options(ssh_bin: str) -> list[str]:
+    """HPN-SSH dynamic TCP window options; stock OpenSSH rejects these"""
+    if not _is_hpn_ssh(ssh_bin):
+        return []
+    return [
+        "-o",
+        "HPNDisabled=no",
+        "-o",
+        "TcpRcvBufPoll=yes",
+        "-o",
+        "HPNBufferSize=8192",
+    ]
+
+
+@functools.cache
+def _cpu_has_aes() -> bool:
+    """Check /proc/cpuinfo for hardware AES (x86 AES-NI or ARMv8 crypto)"""
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text(encoding="utf-8")
+    except OSError:
+        # No cpuinfo (e.g. macOS); every supported CPU there has hardware AES
+        return True
+    for line in cpuinfo.splitlines():
+        if line.startswith(("flags", "Features")):
+            return "aes" in line.split()
+    return False
+
+
+@functools.cache
+def _best_cipher_order(ssh_bin: str) -> str:
+    """Cipher preference list that lands on the hardware-accelerated path"""
+    if _cpu_has_aes():
+        order = [*_AES_CIPHERS, *_CHACHA_CIPHERS]
+    else:
+        order = [*_CHACHA_CIPHERS, *_AES_CIPHERS]
+    supported = _ssh_query(ssh_bin, "cipher")
+    if supported and any(cipher in supported for cipher in order):
+        order = [cipher for cipher in order if cipher in supported]
+    else:
+        # Can't ask the binary, so don't offer the HPN-only cipher name
+        order = [cipher for cipher in order if not cipher.endswith("@hpnssh.org")]
+    return ",".join(order)
+
+
+def _decode_json(text: str) -> Any:
+    """Decode JSON with msgspec's C decoder when installed, else stdlib json
+
+    Decoded untyped: vastai reports nulls for fields of instances that are
+    still starting, which a strict typed decode would reject for the whole
+    listing. Callers catch _JSON_ERRORS for malformed input.
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(text)
+    return json.loads(text)
+
+
+_VAST_CACHE_TTL = 30.0
+_vast_cache: tuple[float, list[VastInstance] | None] | None = None
+
+
+def _load_vast_instances() -> list[VastInstance] | None:
+    """Fetch `vastai show instances`, reusing the result for a short TTL"""
+    global _vast_cache
+    now = time.monotonic()
+    if _vast_cache and now - _vast_cache[0] < _VAST_CACHE_TTL:
+        return _vast_cache[1]
+
+    instances: list[VastInstance] | None = None
     try:
         result = subprocess.run(
             ["vastai", "show", "instances", "--raw"],
@@ -91,12 +274,17 @@ def _load_vast_instance_for_host(hostname: str) -> VastInstance | None:
             text=True,
             check=True,
         )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None
+        instances = cast(list[VastInstance], _decode_json(result.stdout))
+    except (subprocess.CalledProcessError, FileNotFoundError, *_JSON_ERRORS):
+        pass
 
-    try:
-        instances = cast(list[VastInstance], json.loads(result.stdout))
-    except json.JSONDecodeError:
+    _vast_cache = (now, instances)
+    return instances
+
+
+def _load_vast_instance_for_host(hostname: str) -> VastInstance | None:
+    instances = _load_vast_instances()
+    if instances is None:
         return None
 
     running = [inst for inst in instances if inst.get("actual_status") == "running"]
@@ -110,13 +298,16 @@ def _load_vast_instance_for_host(hostname: str) -> VastInstance | None:
     return None
 
 
+_PORT_KEYS = {port: f"{port}/tcp" for port in (22, 2222, 8080)}
+
+
 def _resolve_vast_port(hostname: str, container_port: int) -> str | None:
     inst = _load_vast_instance_for_host(hostname)
     if not inst:
         return None
 
     ports = inst.get("ports", {})
-    key = f"{container_port}/tcp"
+    key = _PORT_KEYS.get(container_port) or f"{container_port}/tcp"
     entries = ports.get(key) or []
     if not entries:
         return None
@@ -7,12 +7,114 @@ Uses parallel transfers for speed and reads connection info from SSH config
 from __future__ import annotations
 
 import argparse
-import shutil
+import heapq
+import io
+import itertools
+import os
+import re
+import shlex
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import IO, Iterable, Iterator
 
-from common import SSHConfig, _resolve_vast_port
+from common import (
+    _SKIP_COMPRESS,
+    SSHConfig,
+    _best_cipher_order,
+    _hpn_window_options,
+    _none_cipher_options,
+    _resolve_vast_port,
+    _scan_tree,
+    _which,
+)
+
+
+# Paths reach rsync's stdin in 1 MiB writes rather than one syscall per entry
+_FILE_LIST_BUFSIZE = 1 << 20
+
+
+# Single files at least this large get their page cache dropped after upload
+_DROP_CACHE_MIN_SIZE = 256 << 20
+
+
+def _drop_page_cache(paths: Iterable[Path]) -> None:
+    """Drop big uploaded files from the page cache so they don't evict hot data"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path_obj in paths:
+        try:
+            if path_obj.stat().st_size < _DROP_CACHE_MIN_SIZE:
+                continue
+            fd = os.open(path_obj, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# rsync's exit status for "some files could not be transferred"
+_PARTIAL_EXIT = 23
+
+
+def _partial_message(label: str, skipped: list[str]) -> str:
+    """Summarise entries the local scan had to skip"""
+    more = f" (+{len(skipped) - 1} more)" if len(skipped) > 1 else ""
+    return f"⚠️ {label}: partial transfer, skipped {skipped[0]}{more}"
+
+
+# --info=progress2 line: "  1,234,567  42%   10.00MB/s    0:00:12 ..."
+_PROGRESS_RE = re.compile(r"^\s*([\d,]+)\s+\d+%")
+
+
+class _ProgressMeter:
+    """One progress2-style line summed over several concurrent rsyncs
+
+    Each rsync's own meter only knows its share of the files, so the jobs'
+    byte counts are added up and shown against everything queued so far.
+    """
+
+    sent: list[int]
+    queued: int
+
+    def __init__(self, jobs: int):
+        self.sent = [0] * jobs
+        self.queued = 0
+        self._started = time.monotonic()
+        self._shown = 0.0
+        self._lock = threading.Lock()
+
+    def follow(self, idx: int, stream: IO[bytes]) -> None:
+        """Track one rsync's progress2 output until it exits"""
+        # Universal newlines turn progress2's \r updates into lines
+        for line in io.TextIOWrapper(stream, errors="replace"):
+            match = _PROGRESS_RE.match(line)
+            if match:
+                self.sent[idx] = int(match[1].replace(",", ""))
+                self.show()
+
+    def show(self, final: bool = False) -> None:
+        """Redraw the line, at most twice a second unless `final`"""
+        with self._lock:
+            now = time.monotonic()
+            if not final and now - self._shown < 0.5:
+                return
+            self._shown = now
+            sent = sum(self.sent)
+            percent = min(100, sent * 100 // self.queued) if self.queued else 0
+            rate = sent / max(now - self._started, 1e-3) / 1e6
+            sys.stdout.write(
+                f"\r{sent:>15,} {percent:>3}% {rate:>8.2f}MB/s"
+                f"  ({len(self.sent)} jobs)" + ("\n" if final else "")
+            )
+            sys.stdout.flush()
 
 
 class FileUploader:
@@ -24,6 +126,12 @@ class FileUploader:
     identity: str
     remote_path: str
     max_workers: int
+    insecure_lan: bool
+    control_path: str
+    _ssh_bin: str | None
+    _none_options: list[str]
+    _ssh_args: str
+    _master_checked: bool
 
     def __init__(
         self,
@@ -33,6 +141,8 @@ class FileUploader:
         identity: str,
         remote_path: str = "/home/user/",
         max_workers: int = 4,
+        insecure_lan: bool = False,
+        ssh_bin: str | None = None,
     ):
         self.host = host
         self.port = port
@@ -40,60 +150,374 @@ class FileUploader:
         self.identity = identity
         self.remote_path = remote_path
         self.max_workers = max_workers
+        self.insecure_lan = insecure_lan
+        # Keyed like ssh's %r@%h:%p, but spelled out so a stale socket can
+        # be found and removed; other runs to the same host share the master
+        self.control_path = str(
+            Path(tempfile.gettempdir()) / f"uploader-cli-{user}@{host}:{port}"
+        )
+        self._master_checked = False
+        # The transport never changes for an instance, so resolve it once
+        self._ssh_bin = ssh_bin or _which("hpnssh")
+        # NONE-cipher sessions skip the ControlMaster; see _none_cipher_options
+        self._none_options = (
+            _none_cipher_options(self._ssh_bin)
+            if insecure_lan and self._ssh_bin
+            else []
+        )
+        if insecure_lan and self._ssh_bin and not self._none_options:
+            print(
+                f"⚠️ {self._ssh_bin} is not HPN-SSH; ignoring --insecure-lan, "
+                "the transfer stays encrypted"
+            )
+        self._ssh_args = self._build_ssh_args()
+
+    def __enter__(self) -> FileUploader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _ssh_options(self, ssh_bin: str) -> list[str]:
+        """Connection options shared by the ControlMaster and rsync transport"""
+        options = ["-p", self.port]
+        if self.identity:
+            options.extend(["-i", self.identity])
+        options.extend(
+            [
+                "-o",
+                "StrictHostKeyChecking=no",
+                "-o",
+                "BatchMode=yes",
+                "-o",
+                "Compression=no",
+                "-o",
+                f"Ciphers={_best_cipher_order(ssh_bin)}",
+                *_hpn_window_options(ssh_bin),
+            ]
+        )
+        if self._none_options:
+            # The server must allow NONE; otherwise the session stays encrypted
+            options.extend(self._none_options)
+        else:
+            options.extend(
+                [
+                    "-o",
+                    f"ControlPath={self.control_path}",
+                    "-o",
+                    "ControlPersist=60",
+                ]
+            )
+        return options
+
+    def _mux_options(self) -> list[str]:
+        """Ride (or start) the shared master, unless sessions use NONE"""
+        return [] if self._none_options else ["-o", "ControlMaster=auto"]
+
+    def _master_alive(self, ssh_bin: str) -> bool:
+        """True if a master (ours or another run's) answers on the socket"""
+        if not os.path.exists(self.control_path):
+            return False
+        try:
+            check = subprocess.run(
+                [
+                    ssh_bin,
+                    "-p",
+                    self.port,
+                    "-S",
+                    self.control_path,
+                    "-O",
+                    "check",
+                    f"{self.user}@{self.host}",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        return check.returncode == 0
+
+    def _ensure_master(self) -> None:
+        """Find or start the shared ControlMaster before the first transfer
+
+        Called lazily, so building an uploader never waits on the network.
+        Best effort: if the master can't start, ControlMaster=auto in the
+        rsync transport simply opens a regular connection.
+        """
+        if self._master_checked:
+            return
+        self._master_checked = True
+        ssh_bin = self._ssh_bin
+        if not ssh_bin or self._none_options or self._master_alive(ssh_bin):
+            return
+        try:
+            # Left behind by a master that died; ssh won't bind over it
+            os.unlink(self.control_path)
+        except FileNotFoundError:
+            pass
+        cmd = [
+            ssh_bin,
+            *self._ssh_options(ssh_bin),
+            "-M",
+            "-N",
+            "-f",
+            f"{self.user}@{self.host}",
+        ]
+        try:
+            # -f returns once the connection is authenticated
+            subprocess.run(
+                cmd, stdin=subprocess.DEVNULL, capture_output=True, timeout=10
+            )
+        except subprocess.TimeoutExpired:
+            pass
+
+    def close(self) -> None:
+        """Stop using the master; it exits on its own after ControlPersist idle
+
+        Other runs to the same host may be multiplexed over it, so it is
+        never told to exit from here.
+        """
+        self._master_checked = False
 
     def _build_ssh_args(self) -> str:
         """Build SSH arguments for rsync"""
-        ssh_bin = shutil.which("hpnssh")
+        ssh_bin = self._ssh_bin
+        if not ssh_bin:
+            return ""
+        return " ".join([ssh_bin, *self._ssh_options(ssh_bin), *self._mux_options()])
+
+    def remote_dir_exists(self, remote_dir: str) -> bool:
+        """Probe the remote side over the shared master with `test -d`"""
+        ssh_bin = self._ssh_bin
         if not ssh_bin:
             raise RuntimeError("hpnssh not found; install HPN-SSH to upload.")
-        ssh_args = f"{ssh_bin} -p {self.port}"
-        if self.identity:
-            ssh_args += f" -i {self.identity}"
-        ssh_args += (
-            " -o StrictHostKeyChecking=no -o BatchMode=yes"
-            " -o Compression=no -o Ciphers=aes128-gcm@openssh.com,chacha20-poly1305@openssh.com"
+        self._ensure_master()
+        cmd = [
+            ssh_bin,
+            *self._ssh_options(ssh_bin),
+            *self._mux_options(),
+            f"{self.user}@{self.host}",
+            f"test -d {shlex.quote(remote_dir)}",
+        ]
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
-        return ssh_args
+        return result.returncode == 0
+
+    def _fresh_args(self, remote_subpath: str, fresh: bool | None) -> list[str]:
+        """Skip the delta algorithm when nothing exists remotely to diff against"""
+        if fresh is None:
+            fresh = not self.remote_dir_exists(f"{self.remote_path}{remote_subpath}")
+        return ["--whole-file", "--inplace"] if fresh else []
 
     def upload_file(
-        self, local_path: str, remote_subpath: str = ""
+        self, local_path: str, remote_subpath: str = "", fresh: bool | None = None
     ) -> tuple[bool, str]:
         """Upload a single file using rsync"""
-        path_obj = Path(local_path)
+        return self.upload_many([local_path], remote_subpath, fresh=fresh)
 
-        if not path_obj.exists():
-            return False, f"File not found: {path_obj}"
+    def _spawn_rsync(
+        self,
+        base: Path,
+        remote_subpath: str,
+        exclude: list[str],
+        fresh_args: list[str],
+        show_progress: bool,
+    ) -> subprocess.Popen[bytes]:
+        """Start an rsync that reads its file list (relative to `base`) on stdin
+
+        rsync's stdout (--info=progress2) goes straight to our terminal when
+        `show_progress` is set; otherwise it is piped back for a
+        _ProgressMeter to sum. stderr is captured for error reporting.
+        """
+        if not self._ssh_args:
+            raise RuntimeError("hpnssh not found; install HPN-SSH to upload.")
+        self._ensure_master()
 
         # Construct remote path
         remote_dest = f"{self.user}@{self.host}:{self.remote_path}"
         if remote_subpath:
             remote_dest += f"{remote_subpath}/"
 
-        # Build rsync command
+        # The scan already expanded directories, so --dirs (no -r) is enough
         cmd = [
             "rsync",
             "-a",  # archive mode, no compression for speed on PNGs
+            "--dirs",
             "--info=progress2",
-            "--skip-compress=png,jpg,jpeg,webp,gif,mp4,mkv,zip,7z",
+            _SKIP_COMPRESS,
+            "--from0",
+            "--files-from=-",
+            *fresh_args,
             "-e",
-            self._build_ssh_args(),
-            str(path_obj),
-            remote_dest,
+            self._ssh_args,
         ]
 
+        for pattern in exclude:
+            cmd.extend(["--exclude", pattern])
+
+        cmd.extend([f"{base}/", remote_dest])
+
+        return subprocess.Popen(
+            cmd,
+            bufsize=_FILE_LIST_BUFSIZE,
+            stdin=subprocess.PIPE,
+            stdout=None if show_progress else subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def _stream_to_rsyncs(
+        self,
+        base: Path,
+        entries: Iterable[tuple[str, int]],
+        jobs: int,
+        remote_subpath: str,
+        exclude: list[str],
+        fresh_args: list[str],
+    ) -> list[str]:
+        """Feed scanned (relpath, size) entries into `jobs` concurrent rsyncs
+
+        Entries are written NUL-terminated straight into each rsync's stdin as
+        the scan produces them, always to the rsync with the fewest bytes so
+        far, so memory stays flat and transfer overlaps the scan. Returns a
+        scan failure, if any, then the stderr of every rsync that failed.
+        """
+        # Several progress2 meters on one terminal would garble each other, so
+        # with more than one job their counts are summed into a single line
+        meter = _ProgressMeter(jobs) if jobs > 1 else None
+        procs = [
+            self._spawn_rsync(
+                base, remote_subpath, exclude, fresh_args, meter is None
+            )
+            for _ in range(jobs)
+        ]
+        stderr_out = [b""] * jobs
+
+        def drain(idx: int) -> None:
+            stream = procs[idx].stderr
+            if stream:
+                stderr_out[idx] = stream.read()
+
+        drainers = [
+            threading.Thread(target=drain, args=(idx,), daemon=True)
+            for idx in range(jobs)
+        ]
+        if meter:
+            drainers.extend(
+                threading.Thread(
+                    target=meter.follow, args=(idx, procs[idx].stdout), daemon=True
+                )
+                for idx in range(jobs)
+            )
+        for thread in drainers:
+            thread.start()
+
+        # (bytes, entries, rsync index): always feed the lightest rsync
+        loads = [(0, 0, idx) for idx in range(jobs)]
+        errors: list[str] = []
         try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return True, f"✅ {path_obj.name}"
-        except subprocess.CalledProcessError as e:
-            return False, f"❌ {path_obj.name}: {e.stderr}"
+            for rel_path, size in entries:
+                if not loads:
+                    break
+                load, count, idx = heapq.heappop(loads)
+                stdin = procs[idx].stdin
+                assert stdin is not None
+                try:
+                    stdin.write(os.fsencode(rel_path) + b"\0")
+                except BrokenPipeError:
+                    continue  # that rsync died; its stderr says why
+                heapq.heappush(loads, (load + size, count + 1, idx))
+                if meter:
+                    meter.queued += size
+        except OSError as e:
+            # Whatever was already queued still goes up; report the rest
+            errors.append(f"scanning failed: {e}")
+        finally:
+            for proc in procs:
+                try:
+                    if proc.stdin:
+                        proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            # Never leave rsyncs running behind an exception or a scan error
+            for thread in drainers:
+                thread.join()
+            returncodes = [proc.wait() for proc in procs]
+            if meter:
+                meter.show(final=True)
+
+        errors.extend(
+            stderr_out[idx].decode(errors="replace")
+            for idx, returncode in enumerate(returncodes)
+            if returncode != 0
+        )
+        return errors
+
+    def upload_many(
+        self,
+        local_paths: list[str],
+        remote_subpath: str = "",
+        exclude: list[str] | None = None,
+        fresh: bool | None = None,
+    ) -> tuple[bool, str]:
+        """Upload several files/folders, one rsync (and SSH session) per parent
+
+        Paths are grouped by parent folder and sent by name via --files-from,
+        so each item lands directly in the destination (as the GUI's drops do)
+        and the handshake and process startup are paid once per group.
+        `fresh` forces/disables whole-file mode; None probes the destination.
+        """
+        paths = [Path(p).absolute() for p in local_paths]
+        if not paths:
+            return False, "Nothing to upload"
+
+        for path_obj in paths:
+            if not path_obj.exists():
+                return False, f"File not found: {path_obj}"
+
+        exclude = exclude or []
+        groups: dict[Path, list[Path]] = {}
+        for path_obj in paths:
+            groups.setdefault(path_obj.parent, []).append(path_obj)
+        skipped: list[str] = []
+
+        def entries(group: list[Path]) -> Iterator[tuple[str, int]]:
+            for path_obj in group:
+                yield path_obj.name, 0
+                if path_obj.is_dir():
+                    yield from _scan_tree(path_obj, path_obj.name, exclude, skipped)
+
+        label = paths[0].name if len(paths) == 1 else f"{len(paths)} items"
+        fresh_args = self._fresh_args(remote_subpath, fresh)
+        errors: list[str] = []
+        for base, group in groups.items():
+            errors.extend(
+                self._stream_to_rsyncs(
+                    base, entries(group), 1, remote_subpath, exclude, fresh_args
+                )
+            )
+        _drop_page_cache(p for p in paths if p.is_file())
+        if errors:
+            return False, f"❌ {label}: {errors[0]}"
+        if skipped:
+            return False, _partial_message(label, skipped)
+        return True, f"✅ {label}"
 
     def upload_folder(
         self,
         local_folder: str,
         remote_subpath: str = "",
         exclude: list[str] | None = None,
+        fresh: bool | None = None,
     ) -> None:
-        """Upload entire folder with parallel file transfers"""
+        """Upload entire folder with parallel file transfers
+
+        The tree is scanned with os.scandir and streamed into `max_workers`
+        rsyncs, balanced by bytes, over the shared ControlMaster so cipher and
+        checksum work spreads across cores.
+        """
         path_obj = Path(local_folder)
 
         if not path_obj.exists():
@@ -104,43 +528,39 @@ class FileUploader:
             print(f"❌ Not a directory: {path_obj}")
             return
 
-        # Use rsync for the whole folder (faster than individual files)
-        remote_dest = f"{self.user}@{self.host}:{self.remote_path}"
-        if remote_subpath:
-            remote_dest += f"{remote_subpath}/"
-
-        cmd = [
-            "rsync",
-            "-av",  # archive, verbose, no compression for speed on PNGs
-            "--info=progress2",
-            "--skip-compress=png,jpg,jpeg,webp,gif,mp4,mkv,zip,7z",
-            "-e",
-            self._build_ssh_args(),
-        ]
+        exclude = exclude or []
+        skipped: list[str] = []
+        entries = _scan_tree(path_obj, "", exclude, skipped)
+        first = next(entries, None)
+        if first is None:
+            print(f"ℹ️ Nothing to upload in {path_obj}")
+            return
 
-        # Add exclusions
-        if exclude:
-            for pattern in exclude:
-                cmd.extend(["--exclude", pattern])
+        fresh_args = self._fresh_args(remote_subpath, fresh)
 
-        cmd.extend(
-            [
-                f"{local_folder}/",  # trailing slash = contents only
-                remote_dest,
-            ]
+        # One write for the whole banner, flushed before rsync takes the tty
+        sys.stdout.write(
+            f"📤 Uploading {path_obj.name}/ to "
+            f"{self.host}:{self.remote_path}{remote_subpath}\n"
+            f"   Streaming file list into {self.max_workers} rsync job(s)\n"
         )
-
-        print(
-            f"📤 Uploading {path_obj.name}/ to {self.host}:{self.remote_path}{remote_subpath}"
+        sys.stdout.flush()
+
+        errors = self._stream_to_rsyncs(
+            path_obj,
+            itertools.chain([first], entries),
+            self.max_workers,
+            remote_subpath,
+            exclude,
+            fresh_args,
         )
-        print(f"   Command: {' '.join(cmd[:3])} ... {path_obj.name}/")
-
-        try:
-            _ = subprocess.run(cmd, check=True)
-            print("✅ Upload complete!")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Upload failed: {e}")
+        if errors:
+            print(f"❌ Upload failed: {errors[0]}")
             sys.exit(1)
+        if skipped:
+            print(_partial_message(path_obj.name, skipped))
+            sys.exit(_PARTIAL_EXIT)
+        print("✅ Upload complete!")
 
 
 def main():
@@ -151,13 +571,17 @@ def main():
 Examples:
   %(prog)s myfile.txt                    # Upload file to /home/user/
   %(prog)s myfolder/                     # Upload entire folder
+  %(prog)s a.png b.png c.png             # Upload several files in one rsync session
   %(prog)s myfile.txt -r uploads/        # Upload to /home/user/uploads/
   %(prog)s . -r project/ -e node_modules -e .git  # Upload current dir, exclude patterns
   %(prog)s myfile.txt --host vast-ai     # Specify different SSH config host
+  %(prog)s ckpt/ --insecure-lan          # Unencrypted payload on a trusted LAN
         """,
     )
 
-    _ = parser.add_argument("path", help="File or folder to upload")
+    _ = parser.add_argument(
+        "path", nargs="+", help="File(s) or folder(s) to upload"
+    )
     _ = parser.add_argument(
         "-r",
         "--remote",
@@ -179,14 +603,29 @@ Examples:
         default="/home/user/",
         help="Remote base path (default: /home/user/)",
     )
+    _ = parser.add_argument(
+        "--fresh",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Whole-file, in-place transfer with no delta pass "
+        "(default: only when the remote directory doesn't exist yet)",
+    )
+    _ = parser.add_argument(
+        "--insecure-lan",
+        action="store_true",
+        help="Use HPN-SSH's NONE cipher after auth, on its own connection rather "
+        "than the shared master (trusted LAN/direct links only)",
+    )
 
     args = parser.parse_args()
 
-    if not shutil.which("hpnssh"):
+    hpnssh = _which("hpnssh")
+    rsync = _which("rsync")
+    if not hpnssh:
         print("❌ hpnssh not found on PATH.")
         print("💡 Install HPN-SSH to use the uploader.")
         sys.exit(1)
-    if not shutil.which("rsync"):
+    if not rsync:
         print("❌ rsync not found on PATH.")
         print("💡 Install rsync to use the uploader.")
         sys.exit(1)
@@ -201,7 +640,7 @@ Examples:
         user = host_info.get("user", "user")
         identity = host_info.get("identity", "")
 
-        if shutil.which("hpnssh") and hostname:
+        if hostname:
             mapped_port = _resolve_vast_port(hostname, 2222)
             if mapped_port:
                 if mapped_port != str(port):
@@ -222,26 +661,38 @@ Examples:
         print("❌ Hostname not found in SSH config")
         sys.exit(1)
 
-    uploader = FileUploader(
+    with FileUploader(
         host=hostname,
         port=str(port),
         user=str(user),
         identity=str(identity),
         remote_path=args.remote_base,
-    )
-
-    # Upload
-    local_path = Path(args.path)
-
-    if local_path.is_file():
-        success, msg = uploader.upload_file(str(local_path), args.remote)
-        print(msg)
-        sys.exit(0 if success else 1)
-    elif local_path.is_dir():
-        uploader.upload_folder(str(local_path), args.remote, exclude=args.exclude)
-    else:
-        print(f"❌ Path not found: {local_path}")
-        sys.exit(1)
+        insecure_lan=args.insecure_lan,
+        ssh_bin=hpnssh,
+    ) as uploader:
+        # Upload
+        if len(args.path) > 1:
+            success, msg = uploader.upload_many(
+                args.path, args.remote, exclude=args.exclude, fresh=args.fresh
+            )
+            print(msg)
+            sys.exit(0 if success else 1)
+
+        local_path = Path(args.path[0])
+
+        if local_path.is_file():
+            success, msg = uploader.upload_file(
+                str(local_path), args.remote, fresh=args.fresh
+            )
+            print(msg)
+            sys.exit(0 if success else 1)
+        elif local_path.is_dir():
+            uploader.upload_folder(
+                str(local_path), args.remote, exclude=args.exclude, fresh=args.fresh
+            )
+        else:
+            print(f"❌ Path not found: {local_path}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -6,24 +6,48 @@ Qt-based UI with drag-and-drop uploads and remote file browser.
 
 from __future__ import annotations
 
+import functools
+import heapq
 import json
+import operator
 import os
+import posixpath
+import re
 import shlex
-import shutil
+import signal
+import sqlite3
 import subprocess
+import sys
 import tempfile
-from datetime import datetime, timezone
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, TypedDict
+from typing import Callable, NamedTuple
 from zoneinfo import ZoneInfo
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from typing_extensions import override
 
-from common import SSHConfig
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
 
+from common import (
+    _SKIP_COMPRESS,
+    SSHConfig,
+    _best_cipher_order,
+    _hpn_window_options,
+    _none_cipher_options,
+    _scan_tree,
+    _which,
+)
 
-class FileSystemItem(TypedDict):
+
+class FileSystemItem(NamedTuple):
     name: str
     display_name: str
     is_dir: bool
@@ -34,6 +58,71 @@ class FileSystemItem(TypedDict):
     mtime: str
 
 
+# Disk-cached listings older than this are re-listed even if the mtime matches,
+# since edits inside a folder don't change the folder's own mtime
+_LISTING_TTL = 300.0
+_CACHE_FORMAT = 2
+# In-memory listings are served without asking the server for this long; after
+# that the disk cache's mtime check decides whether the folder is re-listed
+_MEMORY_TTL = 30.0
+# Missing or unreadable folders are remembered briefly so refresh loops don't
+# keep asking the server about them
+_NEGATIVE_TTL = 2.0
+_MEMORY_ENTRIES = 256
+# Outlives reboots, unlike the temp dir, so a restart starts from warm listings
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser()
+    / "ssh-file-transfer"
+)
+# How long an idle master outlives its last session (and this app)
+_CONTROL_PERSIST = 600
+# Subfolders of the folder on screen that are listed ahead of a click
+_PREFETCH_SUBDIRS = 10
+# The remote shell gets a batch's script as one argument, and Linux caps a
+# single argument at 128 KiB (MAX_ARG_STRLEN); stay well below that
+_SCRIPT_BYTES = 64 * 1024
+
+
+class _CachedListing(NamedTuple):
+    expires: float
+    items: list[FileSystemItem]
+
+
+def _listing_order(entry: FileSystemItem) -> tuple[bool, str]:
+    """Sort key matching the old `ls --group-directories-first` order"""
+    return not entry.is_dir, entry.name
+
+
+def _renamed(entry: FileSystemItem, new_name: str) -> FileSystemItem:
+    display_name = f"{new_name} -> {entry.link_target}" if entry.is_link else new_name
+    return entry._replace(name=new_name, display_name=display_name)
+
+
+def _ssh_options(ssh_bin: str, port: str, identity: str) -> list[str]:
+    """Options for every connection to a host, the shared master included
+
+    A multiplexed session rides its master's transport, so the cipher and
+    HPN window tuning only apply to transfers if the master has them too.
+    """
+    options = ["-p", port]
+    if identity:
+        options.extend(["-i", identity])
+    options.extend(
+        [
+            "-o",
+            "StrictHostKeyChecking=no",
+            "-o",
+            "BatchMode=yes",
+            "-o",
+            "Compression=no",
+            "-o",
+            f"Ciphers={_best_cipher_order(ssh_bin)}",
+            *_hpn_window_options(ssh_bin),
+        ]
+    )
+    return options
+
+
 class RemoteFileSystem:
     """Handle remote filesystem operations via SSH"""
 
@@ -42,41 +131,69 @@ class RemoteFileSystem:
     user: str
     identity: str
     control_path: str
-    cache: dict[str, list[FileSystemItem]]
+    cache: OrderedDict[str, _CachedListing]
+    _cache_lock: threading.Lock
+    _disk: sqlite3.Connection
+    _disk_lock: threading.Lock
+    _master_ready: bool
+    _master_lock: threading.Lock
 
     def __init__(self, host: str, port: str, user: str, identity: str):
         self.host = host
         self.port = port
         self.user = user
         self.identity = identity
+        # Keyed like ssh's %r@%h:%p, so other instances find and share it
         self.control_path = str(
-            Path(tempfile.gettempdir()) / f"uploader-ssh-{os.getpid()}"
+            Path(tempfile.gettempdir()) / f"uploader-ssh-{user}@{host}:{port}"
+        )
+        self._master_ready = False
+        self._master_lock = threading.Lock()
+        self.cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Another user or port on the same host can see a different tree
+        self._disk = sqlite3.connect(
+            _CACHE_DIR / f"{user}@{host}:{port}.db", check_same_thread=False
         )
-        self.cache = {}
+        # Payloads are FileSystemItem rows; drop caches written in another layout
+        if self._disk.execute("PRAGMA user_version").fetchone()[0] != _CACHE_FORMAT:
+            self._disk.executescript(
+                "DROP TABLE IF EXISTS listings; "
+                f"PRAGMA user_version = {_CACHE_FORMAT};"
+            )
+        self._disk.execute(
+            "CREATE TABLE IF NOT EXISTS listings "
+            "(path TEXT PRIMARY KEY, mtime TEXT, fetched REAL, payload TEXT)"
+        )
+        self._disk_lock = threading.Lock()
+
+    def _run_ssh_command(self, command: str | list[str]) -> str:
+        """Execute command on remote host
 
-    def _run_ssh_command(self, command: str) -> str:
-        """Execute command on remote host"""
-        ssh_bin = shutil.which("hpnssh")
+        A list is an argv: it is quoted here, once, for the remote shell that
+        sshd always runs it through.
+        """
+        if isinstance(command, list):
+            command = shlex.join(command)
+        ssh_bin = _which("hpnssh")
         if not ssh_bin:
             raise RuntimeError("hpnssh not found; install HPN-SSH to use the uploader.")
-        ssh_cmd = [
-            ssh_bin,
-            "-p",
-            self.port,
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "BatchMode=yes",
-            "-o",
-            "ControlMaster=auto",
-            "-o",
-            f"ControlPath={self.control_path}",
-            "-o",
-            "ControlPersist=60",
-        ]
-
-        if self.identity:
-            ssh_cmd.extend(["-i", self.identity])
+        ssh_cmd = self._base_ssh_command(ssh_bin)
+        if self._ensure_master(ssh_bin):
+            # Just a multiplexed session on the open master: no TCP or auth
+            ssh_cmd.extend(["-o", "ControlMaster=no", "-S", self.control_path])
+        else:
+            ssh_cmd.extend(
+                [
+                    "-o",
+                    "ControlMaster=auto",
+                    "-o",
+                    f"ControlPath={self.control_path}",
+                    "-o",
+                    f"ControlPersist={_CONTROL_PERSIST}",
+                ]
+            )
 
         ssh_cmd.extend([f"{self.user}@{self.host}", command])
 
@@ -88,78 +205,387 @@ class RemoteFileSystem:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"SSH command failed: {e.stderr}") from e
 
-    def list_directory(self, path: str) -> list[FileSystemItem]:
-        """List files and directories at path"""
-        if path in self.cache:
-            return self.cache[path]
-        command = (
-            f'cd "{path}" 2>/dev/null && '
-            "TZ=UTC ls -lA --time-style=+%Y-%m-%dT%H:%M:%S "
-            '--group-directories-first 2>/dev/null || echo "ERROR"'
-        )
-        output = self._run_ssh_command(command)
+    def _base_ssh_command(self, ssh_bin: str) -> list[str]:
+        return [ssh_bin, *_ssh_options(ssh_bin, self.port, self.identity)]
 
-        if output.strip() == "ERROR":
-            return []
+    def _master_alive(self, ssh_bin: str) -> bool:
+        """True if a master (ours or another instance's) answers on the socket"""
+        if not os.path.exists(self.control_path):
+            return False
+        try:
+            check = subprocess.run(
+                [
+                    *self._base_ssh_command(ssh_bin),
+                    "-S",
+                    self.control_path,
+                    "-O",
+                    "check",
+                    f"{self.user}@{self.host}",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        return check.returncode == 0
 
-        items: list[FileSystemItem] = []
-        for line in output.strip().split("\n"):
-            if not line or line.startswith("total"):
-                continue
+    def _ensure_master(self, ssh_bin: str) -> bool:
+        """Find or start the shared master connection; True once it's usable
 
-            parts = line.split(None, 6)
-            if len(parts) < 7:
-                continue
+        The master backgrounds itself and lingers for ControlPersist after its
+        last session, so a second window or a restarted app reuses it instead
+        of paying for a new handshake.
+        """
+        with self._master_lock:
+            if self._master_ready and os.path.exists(self.control_path):
+                return True
+            self._master_ready = self._master_alive(ssh_bin)
+            if self._master_ready:
+                return True
+            try:
+                # Left behind by a master that died; ssh won't bind over it
+                os.unlink(self.control_path)
+            except FileNotFoundError:
+                pass
+            try:
+                # -f returns once the connection is authenticated
+                result = subprocess.run(
+                    [
+                        *self._base_ssh_command(ssh_bin),
+                        "-M",
+                        "-N",
+                        "-f",
+                        "-o",
+                        f"ControlPath={self.control_path}",
+                        "-o",
+                        f"ControlPersist={_CONTROL_PERSIST}",
+                        f"{self.user}@{self.host}",
+                    ],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=10,
+                )
+            except subprocess.TimeoutExpired:
+                return False
+            self._master_ready = result.returncode == 0 and os.path.exists(
+                self.control_path
+            )
+            return self._master_ready
 
-            perms = parts[0]
-            raw_name = parts[6]
-            mtime = parts[5]
+    def close(self) -> None:
+        """Stop using the master; it exits on its own after ControlPersist idle"""
+        with self._master_lock:
+            self._master_ready = False
 
-            if raw_name in [".", ".."]:
-                continue
+    @staticmethod
+    def _listing_command(path: str, known_mtime: str | None = None) -> str:
+        """Shell snippet that prints `path`'s mtime, then its listing
 
-            is_dir = perms.startswith("d")
-            is_link = perms.startswith("l")
-            link_target: str | None = None
-            display_name = raw_name
+        Every record is NUL-terminated, so any byte but NUL may appear in a
+        name; the first is M<mtime> (find's %T@, so sub-second) and an extra
+        NUL closes the section. If the mtime equals `known_mtime` the listing
+        is replaced by UNCHANGED; if the folder can't be read, by ERROR.
+        """
+        quoted = shlex.quote(path)
+        listing = (
+            f"(cd {quoted} 2>/dev/null && find . -mindepth 1 -maxdepth 1 "
+            "-printf '%y\\t%M\\t%s\\t%T@\\t%f\\t%l\\0' 2>/dev/null "
+            "|| printf 'ERROR\\0')"
+        )
+        if known_mtime:
+            check = f"[ \"$m\" = {shlex.quote(known_mtime)} ] && printf 'UNCHANGED\\0'"
+            listing = f"{check} || {listing}"
+        return (
+            f"m=$(find {quoted} -maxdepth 0 -printf %T@ 2>/dev/null); "
+            "printf 'M%s\\0' \"$m\"; "
+            f"{listing}; printf '\\0'"
+        )
 
-            if is_link and " -> " in raw_name:
-                link_name, link_target = raw_name.split(" -> ", 1)
-                raw_name = link_name
-                display_name = f"{link_name} -> {link_target}"
+    @staticmethod
+    def _parse_listing(records: list[str]) -> list[FileSystemItem]:
+        """Parse tab-separated `find -printf` records into FileSystemItems"""
+        items: list[FileSystemItem] = []
+        for record in records:
+            fields = record.split("\t", 5)
+            if len(fields) < 6:
+                # Status markers (ERROR) and the empty tail after the last NUL
+                continue
 
+            ftype, perms, size, mtime, name, link_target = fields
+            is_link = ftype == "l"
             items.append(
-                {
-                    "name": raw_name,
-                    "display_name": display_name,
-                    "is_dir": is_dir,
-                    "is_link": is_link,
-                    "link_target": link_target,
-                    "perms": perms,
-                    "size": parts[4],
-                    "mtime": mtime,
-                }
+                FileSystemItem(
+                    name,
+                    f"{name} -> {link_target}" if is_link else name,
+                    ftype == "d",
+                    is_link,
+                    link_target if is_link else None,
+                    # A folder has a handful of distinct modes; share the strings
+                    sys.intern(perms),
+                    size,
+                    mtime,
+                )
             )
 
-        self.cache[path] = items
+        # find doesn't sort
+        items.sort(key=_listing_order)
         return items
 
+    def _load_stored(self, path: str) -> tuple[str, list[FileSystemItem]] | None:
+        """Return (mtime, items) from the disk cache if it's within the TTL"""
+        with self._disk_lock:
+            row = self._disk.execute(
+                "SELECT mtime, fetched, payload FROM listings WHERE path = ?", (path,)
+            ).fetchone()
+        if not row or time.time() - row[1] > _LISTING_TTL:
+            return None
+        return row[0], [FileSystemItem(*entry) for entry in json.loads(row[2])]
+
+    def _remember(
+        self, path: str, items: list[FileSystemItem], ttl: float = _MEMORY_TTL
+    ) -> None:
+        """Put a listing in the in-memory LRU, evicting the oldest past the cap"""
+        with self._cache_lock:
+            self.cache[path] = _CachedListing(time.monotonic() + ttl, items)
+            self.cache.move_to_end(path)
+            while len(self.cache) > _MEMORY_ENTRIES:
+                _ = self.cache.popitem(last=False)
+
+    def _cached(self, path: str) -> list[FileSystemItem] | None:
+        """In-memory listing of `path` if it hasn't expired"""
+        with self._cache_lock:
+            entry = self.cache.get(path)
+            if entry is None or time.monotonic() >= entry.expires:
+                return None
+            self.cache.move_to_end(path)
+            return entry.items
+
+    def fresh_listing(self, path: str) -> list[FileSystemItem] | None:
+        """In-memory listing of `path` that is still within its TTL, if any"""
+        return self._cached(path)
+
+    def peek_listing(self, path: str) -> list[FileSystemItem] | None:
+        """Last known listing of `path`, however old, without touching the network"""
+        with self._cache_lock:
+            entry = self.cache.get(path)
+        if entry is not None:
+            return entry.items
+        with self._disk_lock:
+            row = self._disk.execute(
+                "SELECT payload FROM listings WHERE path = ?", (path,)
+            ).fetchone()
+        if not row:
+            return None
+        return [FileSystemItem(*entry) for entry in json.loads(row[0])]
+
+    def _store(self, path: str, mtime: str, items: list[FileSystemItem]) -> None:
+        with self._disk_lock, self._disk:
+            self._disk.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?)",
+                (path, mtime, time.time(), json.dumps(items)),
+            )
+
+    def _fetch_listings(self, paths: list[str]) -> dict[str, list[FileSystemItem]]:
+        """List `paths` with as few SSH calls as fit, returning the listings
+
+        Disk-cached folders are only re-listed if their mtime changed. A
+        folder's mtime only moves when entries are added, removed or renamed,
+        so a file rewritten in place can show a stale size and mtime until the
+        stored copy passes _LISTING_TTL. Records never contain an empty
+        string, so the double NUL that closes each path's section splits the
+        output back per path.
+        """
+        stored = {path: self._load_stored(path) for path in paths}
+        outputs: list[str] = []
+        batch: list[str] = []
+        batch_bytes = 0
+        for path, entry in stored.items():
+            command = self._listing_command(path, entry[0] if entry else None)
+            command_bytes = len(command.encode()) + 2
+            if batch and batch_bytes + command_bytes > _SCRIPT_BYTES:
+                outputs.append(self._run_ssh_command("; ".join(batch)))
+                batch, batch_bytes = [], 0
+            batch.append(command)
+            batch_bytes += command_bytes
+        if batch:
+            outputs.append(self._run_ssh_command("; ".join(batch)))
+        output = "".join(outputs)
+        listings: dict[str, list[FileSystemItem]] = {}
+        # `stored` holds each path once, in the order the sections come back
+        for path, section in zip(stored, output.split("\0\0")):
+            mtime_record, *records = section.split("\0")
+            mtime = mtime_record[1:]
+            entry = stored[path]
+            if entry and records == ["UNCHANGED"]:
+                items = entry[1]
+                self._remember(path, items)
+            elif records == ["ERROR"]:
+                items = []
+                self._remember(path, items, _NEGATIVE_TTL)
+            else:
+                items = self._parse_listing(records)
+                self._remember(path, items)
+                if mtime:
+                    self._store(path, mtime, items)
+            listings[path] = items
+        return listings
+
+    def list_directory(self, path: str) -> list[FileSystemItem]:
+        """List files and directories at path"""
+        items = self._cached(path)
+        if items is None:
+            items = self._fetch_listings([path]).get(path, [])
+        return items
+
+    def list_directories(self, paths: list[str]) -> dict[str, list[FileSystemItem]]:
+        """List several directories with one SSH round-trip"""
+        found: dict[str, list[FileSystemItem]] = {}
+        for path in paths:
+            items = self._cached(path)
+            if items is not None:
+                found[path] = items
+        missing = [path for path in paths if path not in found]
+        if missing:
+            found.update(self._fetch_listings(missing))
+        return {path: found[path] for path in paths if path in found}
+
+    def list_tree(self, root: str, depth: int = 2) -> dict[str, list[FileSystemItem]]:
+        """List `root` and the folders below it, `depth` levels deep, in one call
+
+        Every folder whose contents came back complete (all but the deepest
+        level) goes into the cache, so expanding it later costs no round-trip.
+        """
+        command = (
+            f"find {shlex.quote(root)} -mindepth 1 -maxdepth {depth} "
+            "-printf '%h\\t%y\\t%M\\t%s\\t%T@\\t%f\\t%l\\0' 2>/dev/null"
+        )
+        output = self._run_ssh_command(command)
+
+        groups: dict[str, list[str]] = {}
+        for record in output.split("\0"):
+            parent, _, rest = record.partition("\t")
+            if rest:
+                groups.setdefault(parent or "/", []).append(rest)
+
+        root = root.rstrip("/") or "/"
+        levels = {root: 0}
+        mtimes: dict[str, str] = {}
+        listings: dict[str, list[FileSystemItem]] = {}
+        # Walk down from root; folders above the last level are complete even
+        # when empty (find printed nothing for them)
+        queue = [root]
+        for folder in queue:
+            items = self._parse_listing(groups.get(folder, []))
+            listings[folder] = items
+            for item in items:
+                if item.is_dir and levels[folder] + 1 < depth:
+                    child = f"{folder.rstrip('/')}/{item.name}"
+                    levels[child] = levels[folder] + 1
+                    mtimes[child] = item.mtime
+                    queue.append(child)
+
+        for folder, items in listings.items():
+            self._remember(folder, items)
+            if folder in mtimes:
+                self._store(folder, mtimes[folder], items)
+        return listings
+
     def clear_cache(self, path: str | None = None) -> None:
         """Clear directory cache"""
-        if path:
-            self.cache.pop(path, None)
-        else:
-            self.cache.clear()
+        with self._disk_lock, self._disk:
+            if path:
+                with self._cache_lock:
+                    _ = self.cache.pop(path, None)
+                self._disk.execute("DELETE FROM listings WHERE path = ?", (path,))
+            else:
+                with self._cache_lock:
+                    self.cache.clear()
+                self._disk.execute("DELETE FROM listings")
+
+    def stat_entries(self, path: str, names: list[str]) -> list[FileSystemItem]:
+        """Fetch listing rows for just `names` inside `path`
+
+        A cached listing of `path` is updated in place with the result, so it
+        stays usable without listing the whole folder again.
+        """
+        starts = " ".join(shlex.quote(f"./{name}") for name in names)
+        output = self._run_ssh_command(
+            f"cd {shlex.quote(path)} && find {starts} -maxdepth 0 "
+            "-printf '%y\\t%M\\t%s\\t%T@\\t%f\\t%l\\0' 2>/dev/null || true"
+        )
+        entries = self._parse_listing(output.split("\0"))
+        fresh = {entry.name for entry in entries}
+        with self._cache_lock:
+            cached = self.cache.get(path)
+            if cached is not None:
+                merged = [item for item in cached.items if item.name not in fresh]
+                merged.extend(entries)
+                merged.sort(key=_listing_order)
+                self.cache[path] = cached._replace(items=merged)
+        return entries
+
+    def _patch_cached(self, path: str, name: str, new_name: str | None) -> None:
+        """Rename (or, for None, drop) `name` in the cached listing of `path`
+
+        Listings of the entry itself, of `new_name`, and of anything below
+        either are forgotten. The stored copy of `path` goes too: its mtime
+        has changed, so it could never be revalidated as UNCHANGED anyway.
+        """
+        names = [name] if new_name is None else [name, new_name]
+        with self._disk_lock, self._disk:
+            with self._cache_lock:
+                for gone in (posixpath.join(path, n) for n in names):
+                    prefix = gone + "/"
+                    for key in [
+                        k for k in self.cache if k == gone or k.startswith(prefix)
+                    ]:
+                        del self.cache[key]
+                cached = self.cache.get(path)
+                if cached is not None and new_name is not None and any(
+                    item.name == new_name for item in cached.items
+                ):
+                    # mv replaced that entry, or moved into it if it's a folder;
+                    # list the folder again rather than guess which
+                    del self.cache[path]
+                elif cached is not None:
+                    items = [item for item in cached.items if item.name != name]
+                    if new_name is not None:
+                        items.extend(
+                            _renamed(item, new_name)
+                            for item in cached.items
+                            if item.name == name
+                        )
+                        items.sort(key=_listing_order)
+                    self.cache[path] = cached._replace(items=items)
+            self._disk.execute("DELETE FROM listings WHERE path = ?", (path,))
+            for gone in (posixpath.join(path, n) for n in names):
+                prefix = gone + "/"
+                self._disk.execute(
+                    "DELETE FROM listings WHERE path = ? OR substr(path, 1, ?) = ?",
+                    (gone, len(prefix), prefix),
+                )
 
     def rename_path(self, old_path: str, new_path: str) -> None:
         """Rename/move a file or folder"""
-        cmd = f"mv {shlex.quote(old_path)} {shlex.quote(new_path)}"
-        self._run_ssh_command(cmd)
+        self._run_ssh_command(["mv", "--", old_path, new_path])
+        parent = posixpath.dirname(old_path)
+        if posixpath.dirname(new_path) == parent:
+            self._patch_cached(
+                parent, posixpath.basename(old_path), posixpath.basename(new_path)
+            )
+        else:
+            self._patch_cached(parent, posixpath.basename(old_path), None)
+            self.clear_cache(posixpath.dirname(new_path))
 
     def delete_path(self, target_path: str) -> None:
         """Delete file or folder recursively"""
-        cmd = f"rm -rf {shlex.quote(target_path)}"
-        self._run_ssh_command(cmd)
+        self._run_ssh_command(["rm", "-rf", "--", target_path])
+        self._patch_cached(
+            posixpath.dirname(target_path), posixpath.basename(target_path), None
+        )
 
     def path_exists(self, target_path: str) -> bool:
         """Check if a path exists on the remote server"""
@@ -299,6 +725,29 @@ class ConflictResolutionDialog(QtWidgets.QDialog):
         return self.name_input.text().strip()
 
 
+# --info=progress2 line: "  1,234,567  42%   10.00MB/s    0:00:12 ..."
+_PROGRESS_RE = re.compile(r"^\s*([\d,]+)\s+(\d+)%")
+
+
+def _signal_group(proc: subprocess.Popen[str], sig: int) -> None:
+    """Signal a process started with start_new_session and all its children"""
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _partition_by_size(entries: list[tuple[str, int]], bins: int) -> list[list[str]]:
+    """Split paths into `bins` lists of roughly equal total bytes (largest first)"""
+    heap = [(0, idx) for idx in range(bins)]
+    parts: list[list[str]] = [[] for _ in range(bins)]
+    for rel, size in sorted(entries, key=lambda entry: entry[1], reverse=True):
+        total, idx = heapq.heappop(heap)
+        parts[idx].append(rel)
+        heapq.heappush(heap, (total + size, idx))
+    return [part for part in parts if part]
+
+
 class FileUploader:
     """Handle file uploads using rsync"""
 
@@ -306,27 +755,158 @@ class FileUploader:
     port: str
     user: str
     identity: str
+    max_workers: int
+    compress: bool
+    lan_mode: bool
+    control_path: str | None
+    _cancelled: threading.Event
+    _procs: set[subprocess.Popen[str]]
+    _procs_lock: threading.Lock
 
-    def __init__(self, host: str, port: str, user: str, identity: str):
+    def __init__(
+        self,
+        host: str,
+        port: str,
+        user: str,
+        identity: str,
+        max_workers: int = min(os.cpu_count() or 1, 8),
+        compress: bool = False,
+        control_path: str | None = None,
+        lan_mode: bool = False,
+    ):
         self.host = host
         self.port = port
         self.user = user
         self.identity = identity
+        self.max_workers = max_workers
+        self.compress = compress
+        self.lan_mode = lan_mode
+        self.control_path = control_path
+        self._cancelled = threading.Event()
+        self._procs = set()
+        self._procs_lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """Stop running rsyncs (terminate, then kill); later transfers fail fast"""
+        self._cancelled.set()
+        with self._procs_lock:
+            procs = list(self._procs)
+        for proc in procs:
+            _signal_group(proc, signal.SIGTERM)
+        for proc in procs:
+            try:
+                _ = proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                _signal_group(proc, signal.SIGKILL)
 
     def _build_ssh_args(self) -> str:
         """Build SSH arguments for rsync"""
-        ssh_bin = shutil.which("hpnssh")
+        ssh_bin = _which("hpnssh")
         if not ssh_bin:
             raise RuntimeError("hpnssh not found; install HPN-SSH to use the uploader.")
-        ssh_args = f"{ssh_bin} -p {self.port}"
-        if self.identity:
-            ssh_args += f" -i {self.identity}"
-        ssh_args += (
-            " -o StrictHostKeyChecking=no -o BatchMode=yes"
-            " -o Compression=no -o Ciphers=aes128-gcm@openssh.com,chacha20-poly1305@openssh.com"
-        )
+        # The same options as the browser's master, which these sessions ride
+        ssh_args = " ".join([ssh_bin, *_ssh_options(ssh_bin, self.port, self.identity)])
+        none_options = _none_cipher_options(ssh_bin) if self.lan_mode else []
+        if none_options:
+            # Its own connection, not the browser's master (if the server
+            # allows NONE; otherwise the session stays encrypted)
+            return ssh_args + " " + " ".join(none_options)
+        if self.control_path:
+            # Ride the browser's ControlMaster instead of a fresh handshake
+            ssh_args += (
+                " -o ControlMaster=auto"
+                f" -o ControlPath={self.control_path}"
+                f" -o ControlPersist={_CONTROL_PERSIST}"
+            )
         return ssh_args
 
+    def _upload_flags(self, fresh: bool = True) -> list[str]:
+        """Transfer flags shared by every upload rsync
+
+        The delta algorithm only pays off against an existing remote copy, so
+        files are sent whole. --inplace is only safe when nothing is being
+        replaced: an overwrite keeps rsync's temp-file-and-rename so an
+        interrupted sync never leaves a half-written file behind. zstd level 1
+        is opt-in for slow links.
+        """
+        flags = ["--whole-file", _SKIP_COMPRESS]
+        if fresh:
+            flags.append("--inplace")
+        if self.compress:
+            flags.extend(["-z", "--compress-choice=zstd", "--compress-level=1"])
+        return flags
+
+    def _download_flags(self) -> list[str]:
+        """Transfer flags shared by every download rsync
+
+        On a LAN the link outruns rsync's rolling checksum, so LAN mode sends
+        changed files whole instead of diffing them.
+        """
+        flags = [_SKIP_COMPRESS]
+        if self.lan_mode:
+            flags.append("--whole-file")
+        return flags
+
+    def _run_rsync(
+        self,
+        cmd: list[str],
+        transfer_callback: Callable[[int, int], None] | None = None,
+        file_list: str | None = None,
+    ) -> str | None:
+        """Run rsync, streaming its progress2 updates; return stderr on failure
+
+        stdout is read as it arrives (text mode turns progress2's \\r updates
+        into lines) and each update is passed on as (bytes, percent). stderr
+        is drained on a thread; `file_list` is fed to stdin the same way.
+        """
+        if self._cancelled.is_set():
+            return "Cancelled"
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL if file_list is None else subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="surrogateescape",
+            bufsize=1,
+            # Own process group, so cancel() also reaches rsync's ssh child
+            start_new_session=True,
+        )
+        stderr: list[str] = []
+
+        def drain() -> None:
+            if file_list is not None:
+                try:
+                    proc.stdin.write(file_list)
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            stderr.append(proc.stderr.read())
+
+        with self._procs_lock:
+            self._procs.add(proc)
+        if self._cancelled.is_set():
+            _signal_group(proc, signal.SIGTERM)
+
+        drainer = threading.Thread(target=drain, daemon=True)
+        drainer.start()
+        try:
+            # cancel() terminating rsync closes stdout and ends this loop
+            for line in proc.stdout:
+                match = _PROGRESS_RE.match(line)
+                if match and transfer_callback:
+                    transfer_callback(int(match[1].replace(",", "")), int(match[2]))
+            returncode = proc.wait()
+        finally:
+            with self._procs_lock:
+                self._procs.discard(proc)
+        drainer.join()
+        if self._cancelled.is_set():
+            return "Cancelled"
+        if returncode != 0:
+            return "".join(stderr) or f"rsync exited with status {returncode}"
+        return None
+
     def upload(
         self,
         local_path: str,
@@ -334,6 +914,7 @@ class FileUploader:
         progress_callback: Callable[[bool | None, str], None] | None = None,
         custom_name: str | None = None,
         delete_extra: bool = False,
+        transfer_callback: Callable[[int, int], None] | None = None,
     ) -> bool:
         """Upload file or folder to remote path
 
@@ -342,6 +923,7 @@ class FileUploader:
             remote_path: Remote destination directory
             progress_callback: Optional callback for progress updates
             custom_name: Optional custom name for the uploaded item (for renaming during upload)
+            transfer_callback: Optional callback for (bytes sent, percent) updates
         """
         local_path_obj = Path(local_path)
 
@@ -365,9 +947,10 @@ class FileUploader:
 
         cmd = [
             "rsync",
-            "-av",
+            "-a",
             "--info=progress2",
-            "--skip-compress=png,jpg,jpeg,webp,gif,mp4,mkv,zip,7z",
+            # An overwrite replaces an existing item, so it isn't fresh
+            *self._upload_flags(fresh=not delete_extra),
             "-e",
             self._build_ssh_args(),
         ]
@@ -390,7 +973,16 @@ class FileUploader:
             if progress_callback:
                 progress_callback(None, f"Uploading {item_type} '{display_name}' to {remote_base}/")
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # --delete needs to see the whole tree, so it keeps the single rsync
+            parallel = not delete_extra and self.max_workers > 1
+            if local_path_obj.is_dir() and parallel:
+                error = self._upload_partitioned(
+                    local_path_obj, f"{remote_base}/{display_name}", transfer_callback
+                )
+            else:
+                error = self._run_rsync(cmd, transfer_callback)
+            if error:
+                raise subprocess.CalledProcessError(1, "rsync", stderr=error)
 
             if progress_callback:
                 progress_callback(True, f"✅ {item_type.capitalize()} '{display_name}' written to {dest_path}")
@@ -403,25 +995,240 @@ class FileUploader:
                 progress_callback(False, f"❌ Failed to upload {item_type} '{display_name}': {err}")
             return False
 
+    def upload_many(
+        self,
+        local_paths: list[str],
+        remote_path: str,
+        progress_callback: Callable[[bool | None, str], None] | None = None,
+        transfer_callback: Callable[[int, int], None] | None = None,
+    ) -> bool:
+        """Upload several items that share a parent folder through one rsync
+
+        The names go to rsync via --files-from, so a drop of many small files
+        pays for one rsync startup and handshake instead of one per file.
+        """
+        paths = [Path(p) for p in local_paths]
+        missing = [p for p in paths if not p.exists()]
+        if missing:
+            if progress_callback:
+                progress_callback(False, f"Not found: {missing[0]}")
+            return False
+
+        remote_base = remote_path.rstrip("/")
+        label = f"{len(paths)} items"
+        # --files-from turns off -a's recursion, so dropped folders need -r
+        cmd = [
+            "rsync",
+            "-a",
+            "-r",
+            "--info=progress2",
+            "--from0",
+            "--files-from=-",
+            # "Conflict-free" rests on a listing up to _MEMORY_TTL old, so a
+            # name may have appeared since; don't risk writing over it in place
+            *self._upload_flags(fresh=False),
+            "-e",
+            self._build_ssh_args(),
+            f"{paths[0].parent}/",
+            f"{self.user}@{self.host}:{remote_base}/",
+        ]
+        if progress_callback:
+            progress_callback(None, f"Uploading {label} to {remote_base}/")
+        file_list = "".join(f"{p.name}\0" for p in paths)
+        error = self._run_rsync(cmd, transfer_callback, file_list)
+        if error:
+            if progress_callback:
+                progress_callback(False, f"❌ Failed to upload {label}: {error}")
+            return False
+        if progress_callback:
+            progress_callback(True, f"✅ {label} written to {remote_base}/")
+        return True
+
+    def _upload_partitioned(
+        self,
+        local_dir: Path,
+        remote_dir: str,
+        transfer_callback: Callable[[int, int], None] | None = None,
+    ) -> str | None:
+        """Upload a folder's contents through parallel rsyncs, one per size bin
+
+        The tree is scanned locally and split into `max_workers` lists of about
+        equal bytes; each rsync gets its list via --files-from so all of them
+        share the same source root. Returns the first error, or None.
+        """
+        ssh_args = self._build_ssh_args()
+        # Create the target up front so the rsyncs don't race to mkdir it
+        mkdir = subprocess.run(
+            [
+                *shlex.split(ssh_args),
+                f"{self.user}@{self.host}",
+                f"mkdir -p {shlex.quote(remote_dir)}",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if mkdir.returncode != 0:
+            return mkdir.stderr or f"mkdir {remote_dir} failed"
+
+        skipped: list[str] = []
+        try:
+            entries = list(_scan_tree(local_dir, "", [], skipped))
+        except OSError as e:
+            return f"scanning {local_dir} failed: {e}"
+        remote_dest = f"{self.user}@{self.host}:{remote_dir}/"
+        error = self._rsync_parts(
+            entries,
+            [*self._upload_flags(), "-e", ssh_args, f"{local_dir}/", remote_dest],
+            transfer_callback,
+        )
+        if error is None and skipped:
+            # What rsync itself reports as a partial transfer (exit 23)
+            more = f" (+{len(skipped) - 1} more)" if len(skipped) > 1 else ""
+            return f"partial transfer, skipped {skipped[0]}{more}"
+        return error
+
+    def _rsync_parts(
+        self,
+        entries: list[tuple[str, int]],
+        args: list[str],
+        transfer_callback: Callable[[int, int], None] | None,
+    ) -> str | None:
+        """Run one `rsync ... args` per size bin of `entries`, all at once
+
+        Each rsync reads its share of the relative paths via --files-from, so
+        they all resolve against the same source root. Returns the first error.
+        """
+        parts = _partition_by_size(entries, min(self.max_workers, len(entries)))
+        total_size = sum(size for _, size in entries) or 1
+        sent = [0] * len(parts)
+
+        def run_part(idx: int) -> str | None:
+            def on_transfer(done: int, _percent: int) -> None:
+                sent[idx] = done
+                if transfer_callback:
+                    total = sum(sent)
+                    transfer_callback(total, min(100, total * 100 // total_size))
+
+            cmd = [
+                "rsync",
+                "-a",
+                "--dirs",
+                "--info=progress2",
+                "--from0",
+                "--files-from=-",
+                *args,
+            ]
+            file_list = "".join(f"{rel}\0" for rel in parts[idx])
+            return self._run_rsync(cmd, on_transfer, file_list)
+
+        if not parts:
+            return None
+        with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+            errors = [err for err in pool.map(run_part, range(len(parts))) if err]
+        return errors[0] if errors else None
+
+    def _download_partitioned(
+        self,
+        remote_dir: str,
+        local_dir: Path,
+        transfer_callback: Callable[[int, int], None] | None = None,
+    ) -> str | None:
+        """Download a folder's contents through parallel rsyncs, one per size bin
+
+        The remote tree is listed with one find over SSH and split the same
+        way as an upload. Returns the first error, or None.
+        """
+        if self._cancelled.is_set():
+            return "Cancelled"
+        ssh_args = self._build_ssh_args()
+        # Registered like an rsync, so cancel() also stops a long scan
+        scan = subprocess.Popen(
+            [
+                *shlex.split(ssh_args),
+                f"{self.user}@{self.host}",
+                f"cd {shlex.quote(remote_dir)} && "
+                "find . -mindepth 1 -printf '%y\\t%s\\t%P\\0'",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="surrogateescape",
+            start_new_session=True,
+        )
+        with self._procs_lock:
+            self._procs.add(scan)
+        if self._cancelled.is_set():
+            _signal_group(scan, signal.SIGTERM)
+        try:
+            output, scan_errors = scan.communicate()
+        finally:
+            with self._procs_lock:
+                self._procs.discard(scan)
+        if self._cancelled.is_set():
+            return "Cancelled"
+        # find exits 1 when only some subfolders were unreadable; like a single
+        # rsync, copy everything else and report the transfer as partial
+        partial = scan.returncode == 1 and bool(output)
+        if scan.returncode != 0 and not partial:
+            return scan_errors or f"listing {remote_dir} failed"
+
+        entries: list[tuple[str, int]] = []
+        try:
+            for record in output.split("\0"):
+                ftype, _, rest = record.partition("\t")
+                size, _, rel = rest.partition("\t")
+                if rel:
+                    # Directories only need creating; their st_size isn't payload
+                    entries.append((rel, 0 if ftype == "d" else int(size)))
+            local_dir.mkdir(parents=True, exist_ok=True)
+        except (ValueError, OSError) as e:
+            return f"preparing download of {remote_dir} failed: {e}"
+
+        source = f"{self.user}@{self.host}:{remote_dir.rstrip('/')}/"
+        error = self._rsync_parts(
+            entries,
+            [*self._download_flags(), "-e", ssh_args, source, f"{local_dir}/"],
+            transfer_callback,
+        )
+        if error is None and partial:
+            return f"partial transfer: {scan_errors.strip()}"
+        return error
+
     def download(
         self,
         remote_path: str,
         local_dest: str,
         is_dir: bool,
         progress_callback: Callable[[bool | None, str], None] | None = None,
+        transfer_callback: Callable[[int, int], None] | None = None,
     ) -> bool:
         """Download file or folder from remote"""
         local_dest_path = Path(local_dest)
         local_dest_path.parent.mkdir(parents=True, exist_ok=True)
+        name = posixpath.basename(remote_path)
+
+        if is_dir and self.max_workers > 1:
+            if progress_callback:
+                progress_callback(None, f"Downloading {name}...")
+            error = self._download_partitioned(
+                remote_path, local_dest_path, transfer_callback
+            )
+            if progress_callback:
+                if error:
+                    progress_callback(False, f"❌ Download failed: {error}")
+                else:
+                    progress_callback(True, f"✅ Downloaded {name}")
+            return not error
 
         source = f"{self.user}@{self.host}:{remote_path}"
         if is_dir:
             source = f"{source.rstrip('/')}/"
         cmd = [
             "rsync",
-            "-av",
+            "-a",
             "--info=progress2",
-            "--skip-compress=png,jpg,jpeg,webp,gif,mp4,mkv,zip,7z",
+            *self._download_flags(),
             "-e",
             self._build_ssh_args(),
             source,
@@ -430,10 +1237,12 @@ class FileUploader:
 
         try:
             if progress_callback:
-                progress_callback(None, f"Downloading {Path(remote_path).name}...")
-            _ = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                progress_callback(None, f"Downloading {name}...")
+            error = self._run_rsync(cmd, transfer_callback)
+            if error:
+                raise subprocess.CalledProcessError(1, "rsync", stderr=error)
             if progress_callback:
-                progress_callback(True, f"✅ Downloaded {Path(remote_path).name}")
+                progress_callback(True, f"✅ Downloaded {name}")
             return True
         except subprocess.CalledProcessError as e:
             err = e.stderr or ""
@@ -442,9 +1251,16 @@ class FileUploader:
             return False
 
 
-class UploadWorker(QtCore.QThread):
+class TransferSignals(QtCore.QObject):
     progress: QtCore.Signal = QtCore.Signal(str)
+    bytes_transferred: QtCore.Signal = QtCore.Signal("qint64", int)
     finished_: QtCore.Signal = QtCore.Signal(bool)
+
+
+class UploadRunnable(QtCore.QRunnable):
+    """One queued upload; runs on the window's transfer pool"""
+
+    signals: TransferSignals
     uploader: FileUploader
     local_path: str
     remote_path: str
@@ -460,6 +1276,7 @@ class UploadWorker(QtCore.QThread):
         delete_extra: bool = False,
     ):
         super().__init__()
+        self.signals = TransferSignals()
         self.uploader = uploader
         self.local_path = local_path
         self.remote_path = remote_path
@@ -470,17 +1287,55 @@ class UploadWorker(QtCore.QThread):
     def run(self) -> None:
         def cb(success: bool | None, message: str) -> None:
             if message:
-                self.progress.emit(message)
+                self.signals.progress.emit(message)
 
         success = self.uploader.upload(
-            self.local_path, self.remote_path, cb, self.custom_name, self.delete_extra
+            self.local_path,
+            self.remote_path,
+            cb,
+            self.custom_name,
+            self.delete_extra,
+            self.signals.bytes_transferred.emit,
         )
-        self.finished_.emit(success)
+        self.signals.finished_.emit(success)
 
 
-class DownloadWorker(QtCore.QThread):
-    progress: QtCore.Signal = QtCore.Signal(str)
-    finished_: QtCore.Signal = QtCore.Signal(bool)
+class UploadManyRunnable(QtCore.QRunnable):
+    """Several same-folder items queued as one rsync on the transfer pool"""
+
+    signals: TransferSignals
+    uploader: FileUploader
+    local_paths: list[str]
+    remote_path: str
+
+    def __init__(
+        self, uploader: FileUploader, local_paths: list[str], remote_path: str
+    ):
+        super().__init__()
+        self.signals = TransferSignals()
+        self.uploader = uploader
+        self.local_paths = local_paths
+        self.remote_path = remote_path
+
+    @override
+    def run(self) -> None:
+        def cb(success: bool | None, message: str) -> None:
+            if message:
+                self.signals.progress.emit(message)
+
+        success = self.uploader.upload_many(
+            self.local_paths,
+            self.remote_path,
+            cb,
+            self.signals.bytes_transferred.emit,
+        )
+        self.signals.finished_.emit(success)
+
+
+class DownloadRunnable(QtCore.QRunnable):
+    """One queued download; runs on the window's transfer pool"""
+
+    signals: TransferSignals
     uploader: FileUploader
     remote_path: str
     local_dest: str
@@ -494,6 +1349,7 @@ class DownloadWorker(QtCore.QThread):
         is_dir: bool,
     ):
         super().__init__()
+        self.signals = TransferSignals()
         self.uploader = uploader
         self.remote_path = remote_path
         self.local_dest = local_dest
@@ -503,32 +1359,117 @@ class DownloadWorker(QtCore.QThread):
     def run(self) -> None:
         def cb(success: bool | None, message: str) -> None:
             if message:
-                self.progress.emit(message)
+                self.signals.progress.emit(message)
 
         success = self.uploader.download(
-            self.remote_path, self.local_dest, self.is_dir, cb
+            self.remote_path,
+            self.local_dest,
+            self.is_dir,
+            cb,
+            self.signals.bytes_transferred.emit,
         )
-        self.finished_.emit(success)
+        self.signals.finished_.emit(success)
 
 
-class RemoteListWorker(QtCore.QThread):
-    completed: QtCore.Signal = QtCore.Signal(str, list)
+class ListSignals(QtCore.QObject):
+    completed: QtCore.Signal = QtCore.Signal(str, list, list)
     failed: QtCore.Signal = QtCore.Signal(str)
+
+
+class BatchListSignals(QtCore.QObject):
+    completed: QtCore.Signal = QtCore.Signal(dict)
+    failed: QtCore.Signal = QtCore.Signal(str)
+
+
+class RemoteListWorker(QtCore.QRunnable):
+    """List one folder on the global thread pool"""
+
+    signals: ListSignals
     remote_fs: RemoteFileSystem
     path: str
+    depth: int
+    display: bool
 
-    def __init__(self, remote_fs: RemoteFileSystem, path: str):
+    def __init__(
+        self,
+        remote_fs: RemoteFileSystem,
+        path: str,
+        depth: int = 1,
+        display: bool = False,
+    ):
         super().__init__()
+        self.signals = ListSignals()
         self.remote_fs = remote_fs
         self.path = path
+        self.depth = depth
+        self.display = display
 
     @override
     def run(self) -> None:
         try:
+            if self.depth > 1:
+                _ = self.remote_fs.list_tree(self.path, self.depth)
             items = self.remote_fs.list_directory(self.path)
-            self.completed.emit(self.path, items)
+            # Format the detail view's strings here, off the GUI thread
+            rows = _display_rows(items) if self.display else []
+            self.signals.completed.emit(self.path, items, rows)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class RemoteStatWorker(QtCore.QRunnable):
+    """Fetch rows for a few named entries of one folder"""
+
+    signals: ListSignals
+    remote_fs: RemoteFileSystem
+    path: str
+    names: list[str]
+
+    def __init__(self, remote_fs: RemoteFileSystem, path: str, names: list[str]):
+        super().__init__()
+        self.signals = ListSignals()
+        self.remote_fs = remote_fs
+        self.path = path
+        self.names = names
+
+    @override
+    def run(self) -> None:
+        try:
+            entries = self.remote_fs.stat_entries(self.path, self.names)
+            self.signals.completed.emit(self.path, entries, _display_rows(entries))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class RemoteBatchListWorker(QtCore.QRunnable):
+    """List several folders with one SSH call (also used to warm the cache)"""
+
+    signals: BatchListSignals
+    remote_fs: RemoteFileSystem
+    paths: list[str]
+
+    def __init__(self, remote_fs: RemoteFileSystem, paths: list[str]):
+        super().__init__()
+        self.signals = BatchListSignals()
+        self.remote_fs = remote_fs
+        self.paths = paths
+
+    @override
+    def run(self) -> None:
+        try:
+            listings = self.remote_fs.list_directories(self.paths)
+            self.signals.completed.emit(listings)
         except Exception as e:
-            self.failed.emit(str(e))
+            self.signals.failed.emit(str(e))
+
+
+_SIZE_TABLE = [
+    (1, "B"),
+    (1 << 10, "KB"),
+    (1 << 20, "MB"),
+    (1 << 30, "GB"),
+    (1 << 40, "TB"),
+]
 
 
 def human_size(size_str: str) -> str:
@@ -537,29 +1478,102 @@ def human_size(size_str: str) -> str:
         size = int(size_str)
     except Exception:
         return size_str
-    units = ["B", "KB", "MB", "GB", "TB"]
-    idx = 0
-    while size >= 1024 and idx < len(units) - 1:
-        size /= 1024.0
-        idx += 1
-    value = int(round(size))
-    return f"{value:>6} {units[idx]:>2}"
+    divisor, unit = _SIZE_TABLE[min(max(0, (size.bit_length() - 1) // 10), 4)]
+    value = (size + divisor // 2) // divisor
+    return f"{value:>6} {unit:>2}"
+
+
+@functools.cache
+def _denver_tz() -> ZoneInfo:
+    """Load the tzdata file on first use rather than at import"""
+    return ZoneInfo("America/Denver")
+
 
+_MONTHS = (
+    "January February March April May June July "
+    "August September October November December"
+).split()
 
-def format_mtime(iso_str: str) -> str:
-    """Convert UTC timestamp to Mountain Time for display."""
+
+@functools.lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    mt = datetime.fromtimestamp(minute * 60, tz=_denver_tz())
+    return f"{_MONTHS[mt.month - 1]} {mt.day}, {mt.hour:02d}:{mt.minute:02d}"
+
+
+def format_mtime(epoch_str: str) -> str:
+    """Convert a Unix timestamp to Mountain Time for display."""
+    # find's %T@ has sub-second digits, so nearly every raw string is unique;
+    # the display only shows minutes, so that's what the cache is keyed on
     try:
-        dt = datetime.strptime(iso_str, "%Y-%m-%dT%H:%M:%S").replace(
-            tzinfo=timezone.utc
-        )
-        mt = dt.astimezone(ZoneInfo("America/Denver"))
-        return f"{mt.strftime('%B')} {mt.day}, {mt.hour:02d}:{mt.minute:02d}"
+        return _format_minute(int(float(epoch_str)) // 60)
     except Exception:
-        return iso_str
+        return epoch_str
+
+
+@functools.cache
+def _icon_provider() -> QtWidgets.QFileIconProvider:
+    """One provider for the whole app; only valid once QApplication exists"""
+    return QtWidgets.QFileIconProvider()
+
+
+@functools.lru_cache(maxsize=256)
+def _icon_for_ext(ext: str) -> QtGui.QIcon:
+    """File icon for an extension, looked up (maybe via the OS shell) once"""
+    if not ext:
+        return _icon_provider().icon(QtWidgets.QFileIconProvider.IconType.File)
+    return _icon_provider().icon(QtCore.QFileInfo(f"file{ext}"))
+
+
+class DisplayRow(NamedTuple):
+    """Pre-formatted strings, plus numeric sort keys, for one detail-view row"""
+
+    name: str
+    display_name: str
+    kind: str
+    mtime: str
+    size: str
+    mtime_key: float
+    size_key: float
+
+
+def _sort_number(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+# Row kind by (is_dir, is_link); the icon is then one _kind_icons lookup too
+_KINDS = {
+    (True, False): "folder",
+    (True, True): "folder",
+    (False, True): "link",
+    (False, False): "file",
+}
+
+
+def _display_rows(items: list[FileSystemItem]) -> list[DisplayRow]:
+    return [
+        DisplayRow(
+            item.name,
+            item.display_name,
+            _KINDS[item.is_dir, item.is_link],
+            format_mtime(item.mtime),
+            human_size(item.size),
+            _sort_number(item.mtime),
+            _sort_number(item.size),
+        )
+        for item in items
+    ]
 
 
 TypeRole = QtCore.Qt.ItemDataRole.UserRole + 1
 PathRole = QtCore.Qt.ItemDataRole.UserRole + 2
+IsDirRole = QtCore.Qt.ItemDataRole.UserRole + 3
+LoadedRole = QtCore.Qt.ItemDataRole.UserRole + 4
+# What the detail view sorts on: raw bytes/epoch, not the formatted text
+SortRole = QtCore.Qt.ItemDataRole.UserRole + 5
 
 
 class RemoteTreeView(QtWidgets.QTreeView):
@@ -622,11 +1636,11 @@ class RemoteTreeView(QtWidgets.QTreeView):
             item_type = idx.data(TypeRole)
             name = idx.data(PathRole) or idx.data(QtCore.Qt.ItemDataRole.DisplayRole)
             if item_type == "folder":
-                target_path = str(Path(self.current_path) / name)
+                target_path = posixpath.join(self.current_path, name)
             elif item_type == "link":
-                target_path = str(Path(self.current_path) / name)
+                target_path = posixpath.join(self.current_path, name)
             elif item_type == "parent":
-                target_path = str(Path(self.current_path).parent)
+                target_path = posixpath.dirname(self.current_path)
 
         self.dropRequested.emit(local_paths, target_path)
         event.acceptProposedAction()
@@ -649,7 +1663,7 @@ class RemoteTreeView(QtWidgets.QTreeView):
         delete_action = menu.addAction("Delete")
         action = menu.exec(self.viewport().mapToGlobal(pos))
 
-        full_path = str(Path(self.current_path) / name)
+        full_path = posixpath.join(self.current_path, name)
         if action == download_action:
             self.downloadRequested.emit(full_path, item_type in ("folder", "link"))
         elif bookmark_action and action == bookmark_action:
@@ -733,7 +1747,7 @@ class FolderTreeView(QtWidgets.QTreeView):
         rename_action = menu.addAction("Rename")
         delete_action = menu.addAction("Delete")
         action = menu.exec(self.viewport().mapToGlobal(pos))
-        name = Path(path).name or path
+        name = posixpath.basename(path) or path
         if action == download_action:
             self.downloadRequested.emit(path, True)
         elif action == bookmark_action:
@@ -744,6 +1758,199 @@ class FolderTreeView(QtWidgets.QTreeView):
             self.deleteRequested.emit(path)
 
 
+class LazyFolderModel(QtGui.QStandardItemModel):
+    """Folder tree model whose directories list their contents on first expand"""
+
+    fetchRequested: QtCore.Signal = QtCore.Signal(str)
+
+    def _unloaded_dir(self, index: QtCore.QModelIndex) -> bool:
+        item = self.itemFromIndex(index)
+        return bool(item and item.data(IsDirRole) and not item.data(LoadedRole))
+
+    @override
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        # Unlisted directories still get an expand arrow
+        return self._unloaded_dir(parent) or super().hasChildren(parent)
+
+    @override
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        return self._unloaded_dir(parent)
+
+    @override
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        item = self.itemFromIndex(parent)
+        if not item:
+            return
+        # Marked up front so the view doesn't ask again while the listing runs
+        item.setData(True, LoadedRole)
+        self.fetchRequested.emit(item.data(PathRole))
+
+
+class RemoteDirModel(QtCore.QAbstractTableModel):
+    """Detail-view model that serves cells straight from a listing's DisplayRows
+
+    There are no per-cell item objects: data() reads the row tuple on demand,
+    and showing a new listing is one model reset however long it is. A ".."
+    row, when present, stays on top whatever the sort order.
+    """
+
+    _HEADERS = ("Name", "Modified", "Size")
+    _SORT_FIELDS = ("display_name", "mtime_key", "size_key")
+    _TEXT_FIELDS = ("display_name", "mtime", "size")
+
+    rows: list[DisplayRow]
+    has_parent: bool
+    _kind_icons: dict[str, QtGui.QIcon]
+    _sort_column: int
+    _sort_order: QtCore.Qt.SortOrder
+
+    def __init__(
+        self,
+        kind_icons: dict[str, QtGui.QIcon],
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.rows = []
+        self.has_parent = False
+        self._kind_icons = kind_icons
+        self._sort_column = 0
+        self._sort_order = QtCore.Qt.SortOrder.AscendingOrder
+
+    def set_rows(self, rows: list[DisplayRow], has_parent: bool) -> None:
+        """Show a new listing, in the current sort order"""
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.has_parent = has_parent
+        self._sort_rows()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_rows([], False)
+
+    def append_rows(self, rows: list[DisplayRow]) -> None:
+        """Add entries to the listing on screen, then re-sort"""
+        if not rows:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+        self.sort(self._sort_column, self._sort_order)
+
+    def remove_entry(self, name: str) -> None:
+        """Drop the row showing `name`, if there is one"""
+        for row, entry in enumerate(self.rows):
+            if entry.name == name:
+                model_row = row + self.has_parent
+                self.beginRemoveRows(QtCore.QModelIndex(), model_row, model_row)
+                del self.rows[row]
+                self.endRemoveRows()
+                return
+
+    def replace_entry(self, name: str, new: DisplayRow) -> None:
+        """Show `new` in place of the row for `name`, then re-sort"""
+        for row, entry in enumerate(self.rows):
+            if entry.name == name:
+                self.rows[row] = new
+                model_row = row + self.has_parent
+                self.dataChanged.emit(
+                    self.index(model_row, 0), self.index(model_row, 2)
+                )
+                self.sort(self._sort_column, self._sort_order)
+                return
+
+    def _sort_rows(self) -> None:
+        self.rows.sort(
+            key=operator.attrgetter(self._SORT_FIELDS[self._sort_column]),
+            reverse=self._sort_order == QtCore.Qt.SortOrder.DescendingOrder,
+        )
+
+    @override
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows) + self.has_parent
+
+    @override
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+        ):
+            return self._HEADERS[section]
+        return None
+
+    @override
+    def data(
+        self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole
+    ) -> object:
+        if not index.isValid():
+            return None
+        row = index.row() - self.has_parent
+        column = index.column()
+        if row < 0:
+            if role == TypeRole:
+                return "parent"
+            if role == QtCore.Qt.ItemDataRole.DisplayRole and column == 0:
+                return ".."
+            return None
+
+        entry = self.rows[row]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return getattr(entry, self._TEXT_FIELDS[column])
+        if role == TypeRole:
+            return entry.kind
+        if role == PathRole:
+            return entry.name
+        if role == SortRole:
+            return getattr(entry, self._SORT_FIELDS[column])
+        if column != 0:
+            return None
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            if entry.kind == "file":
+                return _icon_for_ext(posixpath.splitext(entry.name)[1].lower())
+            return self._kind_icons[entry.kind]
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return entry.display_name
+        return None
+
+    @override
+    def sort(
+        self,
+        column: int,
+        order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder,
+    ) -> None:
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        # Keep the selection on the same entries across the reorder
+        persistent = self.persistentIndexList()
+        offset = self.has_parent
+        tracked = [
+            self.rows[index.row() - offset] if index.row() >= offset else None
+            for index in persistent
+        ]
+        self._sort_rows()
+        new_rows = {id(entry): row + offset for row, entry in enumerate(self.rows)}
+        self.changePersistentIndexList(
+            persistent,
+            [
+                index
+                if entry is None
+                else self.index(new_rows[id(entry)], index.column())
+                for index, entry in zip(persistent, tracked)
+            ],
+        )
+        self.layoutChanged.emit()
+
+
 class BookmarkList(QtWidgets.QListWidget):
     navigateRequested: QtCore.Signal = QtCore.Signal(str)
     dropRequested: QtCore.Signal = QtCore.Signal(list, str)
@@ -857,22 +2064,45 @@ class UploaderWindow(QtWidgets.QMainWindow):
     remote_fs: RemoteFileSystem | None
     uploader: FileUploader | None
     current_remote_path: str
-    workers: list[QtCore.QThread]
+    list_pool: QtCore.QThreadPool
+    transfer_pool: QtCore.QThreadPool
+    _upload_progress: dict[int, tuple[int, int]]
+    _uploads_pending: int
     _initializing_hosts: bool
-    folder_workers: dict[str, RemoteListWorker]
     _refresh_expand_flag: bool
     bookmarks_file: Path
     bookmarks: dict[str, list[str]]
-    folder_model: QtGui.QStandardItemModel
+    _bookmark_items: dict[str, QtWidgets.QListWidgetItem]
+    _folder_icon: QtGui.QIcon
+    _file_icon: QtGui.QIcon
+    _link_icon: QtGui.QIcon
+    _kind_icons: dict[str, QtGui.QIcon]
+    folder_model: LazyFolderModel
     folder_tree: FolderTreeView
     bookmark_list: BookmarkList
     path_edit: QtWidgets.QLineEdit
     host_combo: QtWidgets.QComboBox
+    parallel_spin: QtWidgets.QSpinBox
+    lan_check: QtWidgets.QCheckBox
     status_label: QtWidgets.QLabel
-    model: QtGui.QStandardItemModel
+    model: RemoteDirModel
     tree: RemoteTreeView
     log_box: QtWidgets.QPlainTextEdit
+    _log_buffer: list[str]
+    _log_timer: QtCore.QTimer
+    transfer_bar: QtWidgets.QProgressBar
     expanded_folders: set[str]
+    _folder_items: dict[str, QtGui.QStandardItem]
+    _prefetch_queue: dict[str, None]
+    _prefetch_timer: QtCore.QTimer
+    _pending_expand: dict[str, QtGui.QStandardItem]
+    _expand_timer: QtCore.QTimer
+    _in_flight_lists: set[str]
+    _shown_listing: tuple[str, list[FileSystemItem]] | None
+    _in_flight_folders: set[str]
+    _pending_refresh: dict[str, dict[str, None] | None]
+    _refresh_timer: QtCore.QTimer
+    _save_timer: QtCore.QTimer
 
     def __init__(self) -> None:
         super().__init__()
@@ -883,13 +2113,63 @@ class UploaderWindow(QtWidgets.QMainWindow):
         self.remote_fs = None
         self.uploader = None
         self.current_remote_path = "/"
-        self.workers = []
+        self.list_pool = QtCore.QThreadPool.globalInstance()
+        self.list_pool.setMaxThreadCount(min(8, (os.cpu_count() or 1) * 2))
+        # Separate from the global pool so queued transfers never block listings
+        self.transfer_pool = QtCore.QThreadPool(self)
+        self.transfer_pool.setMaxThreadCount(4)
+        self._upload_progress = {}
+        self._uploads_pending = 0
         self._initializing_hosts = False
-        self.folder_workers = {}
         self._refresh_expand_flag = True
         self.bookmarks_file = Path(__file__).parent / "bookmarks.json"
         self.bookmarks = {}
+        self._bookmark_items = {}
         self.expanded_folders = set()
+        self._folder_items = {}
+        self._prefetch_queue = {}
+        self._prefetch_timer = QtCore.QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(50)
+        self._prefetch_timer.timeout.connect(self._flush_prefetch)
+        self._pending_expand = {}
+        self._expand_timer = QtCore.QTimer(self)
+        self._expand_timer.setSingleShot(True)
+        self._expand_timer.setInterval(50)
+        self._expand_timer.timeout.connect(self._flush_expands)
+        self._in_flight_lists = set()
+        self._shown_listing = None
+        self._in_flight_folders = set()
+        self._pending_refresh = {}
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._flush_upload_refreshes)
+        # Bookmark edits are written once things go quiet, not on every click
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_bookmarks)
+        # Transfer progress can log many lines a second; append them per frame
+        self._log_buffer = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Theme icon lookups are slow; resolve the few we use once
+        self._folder_icon = _icon_provider().icon(
+            QtWidgets.QFileIconProvider.IconType.Folder
+        )
+        self._file_icon = _icon_for_ext("")
+        self._link_icon = self.style().standardIcon(
+            QtWidgets.QStyle.StandardPixmap.SP_FileLinkIcon
+        )
+        self._kind_icons = {
+            "folder": self._folder_icon,
+            "link": self._link_icon,
+            "file": self._file_icon,
+        }
 
         self._build_palette()
         self._setup_ui()
@@ -899,37 +2179,62 @@ class UploaderWindow(QtWidgets.QMainWindow):
         app = QtWidgets.QApplication.instance()
         if app:
             app.aboutToQuit.connect(self.stop_workers)
+            app.aboutToQuit.connect(self._flush_bookmarks)
 
     def _load_bookmarks(self) -> None:
         """Load bookmarks from JSON file"""
         if self.bookmarks_file.exists():
             try:
-                with open(self.bookmarks_file, "r", encoding="utf-8") as f:
-                    self.bookmarks = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                data = self.bookmarks_file.read_bytes()
+                self.bookmarks = orjson.loads(data) if orjson else json.loads(data)
+            except (ValueError, IOError):
                 self.bookmarks = {}
         else:
             self.bookmarks = {}
         self._update_bookmark_list()
 
     def _save_bookmarks(self) -> None:
-        """Save bookmarks to JSON file"""
+        """Save bookmarks to JSON file (atomically, via a temp file and rename)"""
+        if orjson:
+            data = orjson.dumps(self.bookmarks, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.bookmarks, indent=2).encode("utf-8")
+        tmp_file = self.bookmarks_file.with_suffix(".tmp")
         try:
-            with open(self.bookmarks_file, "w", encoding="utf-8") as f:
-                json.dump(self.bookmarks, f, indent=2)
+            _ = tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.bookmarks_file)
         except IOError as e:
-            self.log_box.appendPlainText(f"Error saving bookmarks: {e}")
+            self.log(f"Error saving bookmarks: {e}")
+
+    def _flush_bookmarks(self) -> None:
+        """Write a pending bookmark save now instead of waiting for the timer"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_bookmarks()
 
     def _update_bookmark_list(self) -> None:
-        """Update the bookmark list widget"""
-        self.bookmark_list.clear()
+        """Update the bookmark list widget
+
+        Only rows whose bookmark was added or removed are touched; the rest of
+        the widget stays as is.
+        """
         host = self.host_combo.currentText()
-        if host in self.bookmarks:
-            for path in sorted(self.bookmarks[host]):
-                item = QtWidgets.QListWidgetItem(Path(path).name)
-                item.setData(QtCore.Qt.ItemDataRole.UserRole, path)
-                item.setToolTip(path)
-                self.bookmark_list.addItem(item)
+        paths = sorted(self.bookmarks.get(host, []))
+        wanted = set(paths)
+
+        for path in [p for p in self._bookmark_items if p not in wanted]:
+            item = self._bookmark_items.pop(path)
+            _ = self.bookmark_list.takeItem(self.bookmark_list.row(item))
+
+        # Existing rows are already sorted, so each new one goes in at its index
+        for row, path in enumerate(paths):
+            if path in self._bookmark_items:
+                continue
+            item = QtWidgets.QListWidgetItem(posixpath.basename(path))
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, path)
+            item.setToolTip(path)
+            self.bookmark_list.insertItem(row, item)
+            self._bookmark_items[path] = item
 
     def connect_to_host(self) -> None:
         """Connect to the selected host"""
@@ -940,6 +2245,8 @@ class UploaderWindow(QtWidgets.QMainWindow):
         try:
             ssh_config = SSHConfig()
             self.host_info = ssh_config.get_host_info(host)
+            if self.remote_fs:
+                self.remote_fs.close()
             self.remote_fs = RemoteFileSystem(
                 host=self.host_info["hostname"],
                 port=self.host_info["port"],
@@ -951,13 +2258,15 @@ class UploaderWindow(QtWidgets.QMainWindow):
                 port=self.host_info["port"],
                 user=self.host_info["user"],
                 identity=self.host_info["identity"],
+                control_path=self.remote_fs.control_path,
+                lan_mode=self.lan_check.isChecked(),
             )
-            self.log_box.appendPlainText(f"Connected to {host}")
+            self.log(f"Connected to {host}")
             self._initialize_folder_view()
             self.refresh_remote_view()
             self._update_bookmark_list()
         except Exception as e:
-            self.log_box.appendPlainText(f"Failed to connect to {host}: {e}")
+            self.log(f"Failed to connect to {host}: {e}")
 
     def _populate_hosts(self) -> None:
         """Populate host dropdown from SSH config"""
@@ -971,7 +2280,7 @@ class UploaderWindow(QtWidgets.QMainWindow):
                 self.host_combo.setCurrentIndex(0)
                 self.connect_to_host()
         except Exception as e:
-            self.log_box.appendPlainText(f"Error loading hosts: {e}")
+            self.log(f"Error loading hosts: {e}")
         finally:
             self._initializing_hosts = False
 
@@ -980,23 +2289,28 @@ class UploaderWindow(QtWidgets.QMainWindow):
         self.folder_model.clear()
         self.folder_tree.setRootIndex(QtCore.QModelIndex())  # Reset root index
         self.expanded_folders.clear()
+        self._folder_items.clear()
+        self._prefetch_queue.clear()
+        self._pending_expand.clear()
 
         if not self.host_info or not self.remote_fs:
             return
 
         root_path = "/"
 
-        icon_provider = QtWidgets.QFileIconProvider()
-        folder_icon = icon_provider.icon(QtWidgets.QFileIconProvider.IconType.Folder)
-
-        root_item = QtGui.QStandardItem(folder_icon, root_path)
+        root_item = QtGui.QStandardItem(self._folder_icon, root_path)
         root_item.setData(root_path, PathRole)
+        root_item.setData(True, IsDirRole)
+        # Loaded below, two levels at once
+        root_item.setData(True, LoadedRole)
         root_item.setEditable(False)
 
         self.folder_model.appendRow(root_item)
+        self._folder_items[root_path] = root_item
 
         # Manually load root folder contents
-        self._load_folder_contents(root_item, root_path)
+        # One find two levels deep fills the cache for root and its children
+        self._load_folder_contents(root_item, root_path, depth=2)
 
         # Expand root after loading starts
         self.folder_tree.expand(root_item.index())
@@ -1004,78 +2318,153 @@ class UploaderWindow(QtWidgets.QMainWindow):
 
     def stop_workers(self) -> None:
         """Stop all running workers"""
-        for worker in self.workers:
-            if worker.isRunning():
-                worker.terminate()
-                worker.wait()
-
-    def _load_folder_contents(self, item: QtGui.QStandardItem, path: str) -> None:
+        self.transfer_pool.clear()
+        if self.uploader:
+            self.uploader.cancel()
+        # Queued listings are dropped; running ones are bounded by the SSH timeout
+        self.list_pool.clear()
+        _ = self.transfer_pool.waitForDone(2000)
+        _ = self.list_pool.waitForDone(2000)
+        if self.remote_fs:
+            self.remote_fs.close()
+
+    def _load_folder_contents(
+        self, item: QtGui.QStandardItem, path: str, depth: int = 1
+    ) -> None:
         """Load folder contents for a given item and path"""
         if not self.remote_fs:
             return
 
-        worker = RemoteListWorker(self.remote_fs, path)
+        remote_fs = self.remote_fs
+        worker = RemoteListWorker(remote_fs, path, depth)
 
-        def on_complete(p: str, items: list[FileSystemItem]) -> None:
-            if p != path:
+        # After a host change the item is gone and the path means another tree
+        def on_complete(
+            p: str, items: list[FileSystemItem], _: list[DisplayRow]
+        ) -> None:
+            if self.remote_fs is not remote_fs:
                 return
+            self._in_flight_folders.discard(path)
+            if p == path:
+                self._populate_folder_item(item, p, items)
 
-            icon_provider = QtWidgets.QFileIconProvider()
-            folder_icon = icon_provider.icon(
-                QtWidgets.QFileIconProvider.IconType.Folder
-            )
-            file_icon = icon_provider.icon(QtWidgets.QFileIconProvider.IconType.File)
-
-            for file_item in items:
-                name = file_item["name"]
-                full_path = str(Path(p) / name)
-
-                is_folder_like = file_item["is_dir"] or file_item["is_link"]
-                icon = folder_icon if is_folder_like else file_icon
-
-                child_item = QtGui.QStandardItem(icon, name)
-                child_item.setData(full_path, PathRole)
-                child_item.setEditable(False)
+        def on_failed(error: str) -> None:
+            if self.remote_fs is not remote_fs:
+                return
+            self._in_flight_folders.discard(path)
+            self._on_list_failed(error)
+
+        worker.signals.completed.connect(on_complete)
+        worker.signals.failed.connect(on_failed)
+        self._in_flight_folders.add(path)
+        self.list_pool.start(worker)
+
+    def _populate_folder_item(
+        self, item: QtGui.QStandardItem, path: str, items: list[FileSystemItem]
+    ) -> None:
+        """Add a listing's entries as children of a folder tree item"""
+        children: list[QtGui.QStandardItem] = []
+        subfolders: list[str] = []
+        for file_item in items:
+            name = file_item.name
+            full_path = posixpath.join(path, name)
+
+            is_folder_like = file_item.is_dir or file_item.is_link
+            if is_folder_like:
+                icon = self._folder_icon
+            else:
+                icon = _icon_for_ext(posixpath.splitext(name)[1].lower())
+
+            child_item = QtGui.QStandardItem(icon, name)
+            child_item.setData(full_path, PathRole)
+            child_item.setData(is_folder_like, IsDirRole)
+            child_item.setEditable(False)
+            self._folder_items[full_path] = child_item
+
+            if is_folder_like:
+                subfolders.append(full_path)
+
+            children.append(child_item)
+
+        # One insert (one rowsInserted) and one repaint for the whole listing;
+        # a caller that already holds updates off keeps them off
+        updates = self.folder_tree.updatesEnabled()
+        self.folder_tree.setUpdatesEnabled(False)
+        item.setData(True, LoadedRole)
+        item.appendRows(children)
+        self.folder_tree.setUpdatesEnabled(updates)
+
+        self._queue_prefetch(subfolders[:_PREFETCH_SUBDIRS])
+
+    def _clear_children(self, item: QtGui.QStandardItem) -> None:
+        """Remove an item's children and drop their subtree from the path index"""
+        stack = [item.child(row) for row in range(item.rowCount())]
+        while stack:
+            child = stack.pop()
+            if child is None:
+                continue
+            self._folder_items.pop(child.data(PathRole), None)
+            stack.extend(child.child(row) for row in range(child.rowCount()))
+        item.removeRows(0, item.rowCount())
 
-                if is_folder_like:
-                    dummy_item = QtGui.QStandardItem()
-                    dummy_item.setEditable(False)
-                    child_item.appendRow(dummy_item)
+    def _queue_prefetch(self, paths: list[str]) -> None:
+        """Collect folders whose listings should be fetched in the next batch"""
+        for path in paths:
+            self._prefetch_queue[path] = None
+        if self._prefetch_queue:
+            self._prefetch_timer.start()
+
+    def _flush_prefetch(self) -> None:
+        """List every queued folder through one SSH command"""
+        if not self.remote_fs or not self._prefetch_queue:
+            self._prefetch_queue.clear()
+            return
 
-                item.appendRow(child_item)
+        paths = list(self._prefetch_queue)
+        self._prefetch_queue.clear()
+        # Best effort: an expand that misses the cache lists on its own
+        worker = RemoteBatchListWorker(self.remote_fs, paths)
+        self.list_pool.start(worker)
+
+    def _flush_expands(self) -> None:
+        """Load every folder expanded since the last tick through one worker"""
+        pending = self._pending_expand
+        self._pending_expand = {}
+        if not self.remote_fs or not pending:
+            return
 
-            self.workers = [w for w in self.workers if not w.isFinished()]
+        def on_complete(listings: dict[str, list[FileSystemItem]]) -> None:
+            for path, items in listings.items():
+                if path in pending:
+                    self._populate_folder_item(pending[path], path, items)
+
+        def on_failed(error: str) -> None:
+            # Let the next expand try again
+            for item in pending.values():
+                item.setData(False, LoadedRole)
+            self._on_list_failed(error)
+
+        worker = RemoteBatchListWorker(self.remote_fs, list(pending))
+        worker.signals.completed.connect(on_complete)
+        worker.signals.failed.connect(on_failed)
+        self.list_pool.start(worker)
+
+    def on_folder_fetch(self, path: str) -> None:
+        """Load a folder's contents when the view first needs its children"""
+        item = self._folder_items.get(path)
+        if not item or not self.remote_fs:
+            return
 
-        worker.completed.connect(on_complete)
-        worker.failed.connect(self._on_list_failed)
-        self.workers.append(worker)
-        worker.start()
+        # Coalesce bursts of expands (keyboard, expand-all) into one SSH call
+        self._pending_expand[path] = item
+        self._expand_timer.start()
 
     def on_folder_expanded(self, index: QtCore.QModelIndex) -> None:
-        """Dynamically load folder contents when expanded"""
-        item = self.folder_model.itemFromIndex(index)
-        if not item:
-            return
-
-        path = item.data(PathRole)
+        """Track expanded folders so uploads can refresh them"""
+        path = index.data(PathRole)
         if path:
             self.expanded_folders.add(path)
 
-        # If item has a dummy child, remove it before loading real children
-        if item.hasChildren():
-            first_child = item.child(0)
-            if first_child and first_child.data(PathRole) is None:
-                item.removeRow(0)
-            else:
-                # Already populated
-                return
-
-        if not path or not self.remote_fs:
-            return
-
-        # Use the common loading method
-        self._load_folder_contents(item, path)
-
     def on_folder_clicked(self, index: QtCore.QModelIndex) -> None:
         """Update main view when a folder is clicked"""
         path = index.data(PathRole)
@@ -1083,8 +2472,8 @@ class UploaderWindow(QtWidgets.QMainWindow):
         if not item or not path:
             return
 
-        # If it's a file (no children and no dummy child), don't navigate
-        if not item.hasChildren():
+        # Files have nothing to show in the main view
+        if not item.data(IsDirRole):
             return
 
         if path and path != self.current_remote_path:
@@ -1094,33 +2483,14 @@ class UploaderWindow(QtWidgets.QMainWindow):
 
     def _find_folder_item(self, path: str) -> QtGui.QStandardItem | None:
         """Find a folder item by its path in the folder tree"""
-
-        def search_item(
-            item: QtGui.QStandardItem, target_path: str
-        ) -> QtGui.QStandardItem | None:
-            if item.data(PathRole) == target_path:
-                return item
-            for row in range(item.rowCount()):
-                child = item.child(row)
-                if child:
-                    result = search_item(child, target_path)
-                    if result:
-                        return result
-            return None
-
-        root = self.folder_model.invisibleRootItem()
-        for row in range(root.rowCount()):
-            item = root.child(row)
-            if item:
-                result = search_item(item, path)
-                if result:
-                    return result
-        return None
+        return self._folder_items.get(path)
 
     def _refresh_expanded_folder(self, path: str) -> None:
         """Refresh an expanded folder's contents"""
         if not self.remote_fs or path not in self.expanded_folders:
             return
+        if path in self._in_flight_folders:
+            return
 
         item = self._find_folder_item(path)
         if not item:
@@ -1129,101 +2499,245 @@ class UploaderWindow(QtWidgets.QMainWindow):
         # Clear cache for this path
         self.remote_fs.clear_cache(path)
 
-        # Remove all children
-        item.removeRows(0, item.rowCount())
+        # Remove all children; one repaint instead of one per removed row
+        self.folder_tree.setUpdatesEnabled(False)
+        self._clear_children(item)
+        self.folder_tree.setUpdatesEnabled(True)
 
         # Load fresh data using the common method
         self._load_folder_contents(item, path)
 
     def on_folder_collapsed(self, index: QtCore.QModelIndex) -> None:
-        """Clear children when a folder is collapsed to allow reloading"""
-        item = self.folder_model.itemFromIndex(index)
-        if item:
-            path = item.data(PathRole)
-            if path:
-                self.expanded_folders.discard(path)
+        """Stop tracking a collapsed folder; its children stay for the next expand"""
+        path = index.data(PathRole)
+        if path:
+            self.expanded_folders.discard(path)
 
-            if item.hasChildren():
-                # Don't remove if it's already a dummy
-                if item.child(0).data(PathRole) is not None:
-                    item.removeRows(0, item.rowCount())
-                    # Add dummy item back
-                    dummy_item = QtGui.QStandardItem()
-                    dummy_item.setEditable(False)
-                    item.appendRow(dummy_item)
+    def _invalidate_folder(self, path: str) -> None:
+        """Drop a collapsed folder's children so its next expand lists it again"""
+        item = self._folder_items.get(path)
+        if item and item.data(LoadedRole) and path not in self._in_flight_folders:
+            self._clear_children(item)
+            item.setData(False, LoadedRole)
 
     def handle_drop(self, local_paths: list[str], remote_path: str) -> None:
-        """Handle drag and drop operation"""
+        """Handle drag and drop operation
+
+        Name conflicts are found in the destination's listing: a fresh cached
+        one is used as is, otherwise it is fetched off the UI thread first.
+        """
         if not self.uploader or not self.remote_fs:
             return
 
+        existing = self.remote_fs.fresh_listing(remote_path)
+        if existing is not None:
+            self._upload_dropped(local_paths, remote_path, existing)
+            return
+
+        remote_fs = self.remote_fs
+
+        def on_complete(
+            _: str, items: list[FileSystemItem], __: list[DisplayRow]
+        ) -> None:
+            # The host changed meanwhile; don't send the drop to the new one
+            if self.remote_fs is remote_fs:
+                self._upload_dropped(local_paths, remote_path, items)
+
+        worker = RemoteListWorker(remote_fs, remote_path)
+        worker.signals.completed.connect(on_complete)
+        worker.signals.failed.connect(self._on_list_failed)
+        self.list_pool.start(worker)
+
+    def _upload_dropped(
+        self, local_paths: list[str], remote_path: str, existing: list[FileSystemItem]
+    ) -> None:
+        """Queue uploads for dropped paths, asking about names already taken"""
+        if not self.uploader:
+            return
+
+        taken = {item.name for item in existing}
+        # Conflict-free items are grouped by local parent, one rsync per group;
+        # each group maps local path -> name
+        batches: dict[str, dict[str, str]] = {}
         for path in local_paths:
-            local_path_obj = Path(path)
-            original_name = local_path_obj.name
-            target_path = str(Path(remote_path) / original_name)
-            item_type = "folder" if local_path_obj.is_dir() else "file"
+            parent, original_name = os.path.split(os.path.normpath(path))
 
             # Check if the target already exists
-            if self.remote_fs.path_exists(target_path):
+            if original_name in taken:
                 # Show conflict resolution dialog
-                is_dir = local_path_obj.is_dir()
+                is_dir = os.path.isdir(path)
+                item_type = "folder" if is_dir else "file"
                 dialog = ConflictResolutionDialog(self, original_name, is_dir)
                 result = dialog.exec()
 
                 if result != QtWidgets.QDialog.DialogCode.Accepted:
                     # User cancelled
-                    self.log_box.appendPlainText(f"⏭ Skipped: {original_name}")
+                    self.log(f"⏭ Skipped: {original_name}")
                     continue
 
                 new_name = dialog.get_name()
 
                 if not new_name:
                     # Empty name, skip
-                    self.log_box.appendPlainText(f"⏭ Skipped: {original_name} (empty name)")
+                    self.log(f"⏭ Skipped: {original_name} (empty name)")
                     continue
 
                 # If name changed, use custom_name; if same, overwrite (no custom_name)
                 custom_name = new_name if new_name != original_name else None
 
                 if custom_name:
-                    self.log_box.appendPlainText(
+                    self.log(
                         f"📝 Renaming {original_name} → {custom_name} during upload"
                     )
-                    worker = UploadWorker(self.uploader, path, remote_path, custom_name, False)
+                    task = UploadRunnable(self.uploader, path, remote_path, custom_name, False)
                 else:
                     # Overwrite: use rsync --delete to sync and remove extra files
-                    self.log_box.appendPlainText(f"♻️ Syncing {item_type} '{original_name}' (rsync will update and remove extra files)")
-                    worker = UploadWorker(self.uploader, path, remote_path, None, True)
+                    self.log(f"♻️ Syncing {item_type} '{original_name}' (rsync will update and remove extra files)")
+                    task = UploadRunnable(self.uploader, path, remote_path, None, True)
             else:
                 # No conflict, upload normally
-                worker = UploadWorker(self.uploader, path, remote_path, None, False)
+                batches.setdefault(parent, {})[path] = original_name
+                continue
 
-            worker.progress.connect(self._log_upload_progress)
-            worker.finished_.connect(
-                lambda success, target=remote_path: self._on_upload_complete(
-                    success, target
-                )
+            self._queue_upload(task, remote_path, [task.custom_name or original_name])
+
+        for group in batches.values():
+            paths = list(group)
+            names = list(group.values())
+            if len(paths) == 1:
+                task = UploadRunnable(self.uploader, paths[0], remote_path)
+            else:
+                task = UploadManyRunnable(self.uploader, paths, remote_path)
+            self._queue_upload(task, remote_path, names)
+
+    def _queue_upload(
+        self,
+        task: UploadRunnable | UploadManyRunnable,
+        remote_path: str,
+        names: list[str],
+    ) -> None:
+        """Hook an upload's signals into the shared progress bar and start it"""
+        key = id(task)
+        self._upload_progress[key] = (0, 0)
+        self._uploads_pending += 1
+        task.signals.progress.connect(self._log_upload_progress)
+        task.signals.bytes_transferred.connect(
+            lambda done, percent, key=key: self._on_upload_progress(key, done, percent)
+        )
+        task.signals.finished_.connect(
+            lambda success, target=remote_path, key=key, names=names: (
+                self._on_upload_complete(success, target, key, names)
             )
-            self.workers.append(worker)
-            worker.start()
+        )
+        self.transfer_pool.start(task)
+
+    def log(self, message: str) -> None:
+        """Queue a line for the log box; queued lines are appended together"""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if self._log_buffer:
+            self.log_box.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def _log_upload_progress(self, message: str) -> None:
         """Filter and format upload progress messages"""
         # Log all messages from the upload process
-        self.log_box.appendPlainText(message)
+        self.log(message)
+
+    def _on_transfer_progress(self, done: int, percent: int) -> None:
+        """Show live rsync byte counts in the transfer bar"""
+        self.transfer_bar.setValue(percent)
+        self.transfer_bar.setFormat(f"%p%  ·  {human_size(str(done)).strip()}")
+        self.transfer_bar.show()
+
+    def _on_upload_progress(self, key: int, done: int, percent: int) -> None:
+        """Fold one upload's progress into the totals for all queued uploads"""
+        self._upload_progress[key] = (done, percent)
+        total_done = sum(entry[0] for entry in self._upload_progress.values())
+        total_percent = sum(entry[1] for entry in self._upload_progress.values())
+        self._on_transfer_progress(
+            total_done, total_percent // len(self._upload_progress)
+        )
 
-    def _on_upload_complete(self, success: bool, target_path: str) -> None:
+    def _on_upload_complete(
+        self,
+        success: bool,
+        target_path: str,
+        key: int | None = None,
+        uploaded: list[str] | None = None,
+    ) -> None:
         """Handle upload completion - refresh views if they're showing the upload destination"""
+        if key is not None:
+            # Finished uploads count as 100% until the whole batch is done
+            done, _ = self._upload_progress.get(key, (0, 0))
+            self._upload_progress[key] = (done, 100)
+            self._uploads_pending -= 1
+        if self._uploads_pending <= 0:
+            self._upload_progress.clear()
+            self.transfer_bar.hide()
         if not success:
             return
 
-        # Refresh the detailed view if it's showing the upload destination
-        if self.current_remote_path == target_path:
-            self.refresh_remote_view(force=True)
+        # A burst of completions into one folder becomes a single refresh;
+        # None means the uploaded names aren't known and it must be a full one
+        if uploaded is None:
+            self._pending_refresh[target_path] = None
+        else:
+            names = self._pending_refresh.setdefault(target_path, {})
+            if names is not None:
+                names.update(dict.fromkeys(uploaded))
+        self._refresh_timer.start()
+
+    def _flush_upload_refreshes(self) -> None:
+        """Refresh the views showing any folder that uploads landed in"""
+        targets = list(self._pending_refresh.items())
+        self._pending_refresh.clear()
+        for target_path, names in targets:
+            # Refresh the detailed view if it's showing the upload destination
+            if self.current_remote_path == target_path:
+                if names and self._can_insert_rows(target_path, list(names)):
+                    self._insert_uploaded_rows(target_path, list(names))
+                else:
+                    self.refresh_remote_view(force=True)
 
-        # Refresh the folder tree if the upload destination is expanded
-        if target_path in self.expanded_folders:
-            self._refresh_expanded_folder(target_path)
+            # Refresh the folder tree if the upload destination is expanded
+            if target_path in self.expanded_folders:
+                self._refresh_expanded_folder(target_path)
+            else:
+                self._invalidate_folder(target_path)
+
+    def _can_insert_rows(self, path: str, names: list[str]) -> bool:
+        """True if `names` are new rows for the listing currently on screen"""
+        if not self._shown_listing or self._shown_listing[0] != path:
+            return False
+        shown = {item.name for item in self._shown_listing[1]}
+        return not any(name in shown for name in names)
+
+    def _insert_uploaded_rows(self, path: str, names: list[str]) -> None:
+        """Add rows for freshly uploaded entries without re-listing the folder"""
+        if not self.remote_fs:
+            return
+
+        def on_complete(
+            p: str, entries: list[FileSystemItem], rows: list[DisplayRow]
+        ) -> None:
+            # Re-check: the view may have moved on or been refreshed meanwhile
+            if p != self.current_remote_path or not self._can_insert_rows(
+                p, [entry.name for entry in entries]
+            ):
+                self.refresh_remote_view(force=True)
+                return
+            self.model.append_rows(rows)
+            shown = self._shown_listing[1] if self._shown_listing else []
+            self._shown_listing = (p, shown + entries)
+
+        worker = RemoteStatWorker(self.remote_fs, path, names)
+        worker.signals.completed.connect(on_complete)
+        worker.signals.failed.connect(lambda _: self.refresh_remote_view(force=True))
+        self.list_pool.start(worker)
 
     def handle_rename(self, path: str, name: str) -> None:
         """Handle rename request"""
@@ -1236,19 +2750,16 @@ class UploaderWindow(QtWidgets.QMainWindow):
         if not self.remote_fs:
             return
 
-        parent_path = Path(path).parent
-        new_path = str(parent_path / new_name)
+        parent_path = posixpath.dirname(path)
+        new_path = posixpath.join(parent_path, new_name)
 
         try:
             self.remote_fs.rename_path(path, new_path)
-            self.log_box.appendPlainText(f"Renamed: {path} -> {new_path}")
-            # Refresh parent directory
-            if str(parent_path) == self.current_remote_path:
-                self.refresh_remote_view(force=True)
-            else:
-                self.remote_fs.clear_cache(str(parent_path))
+            self.log(f"Renamed: {path} -> {new_path}")
+            if parent_path == self.current_remote_path:
+                self._patch_shown_listing(posixpath.basename(path), new_name)
         except Exception as e:
-            self.log_box.appendPlainText(f"Error renaming {path}: {e}")
+            self.log(f"Error renaming {path}: {e}")
 
     def handle_delete(self, path: str) -> None:
         """Handle delete request"""
@@ -1270,15 +2781,35 @@ class UploaderWindow(QtWidgets.QMainWindow):
 
         try:
             self.remote_fs.delete_path(path)
-            self.log_box.appendPlainText(f"Deleted: {path}")
-            # Refresh parent directory
-            parent_path = str(Path(path).parent)
-            if parent_path == self.current_remote_path:
-                self.refresh_remote_view(force=True)
-            else:
-                self.remote_fs.clear_cache(parent_path)
+            self.log(f"Deleted: {path}")
+            if posixpath.dirname(path) == self.current_remote_path:
+                self._patch_shown_listing(posixpath.basename(path), None)
         except Exception as e:
-            self.log_box.appendPlainText(f"Error deleting {path}: {e}")
+            self.log(f"Error deleting {path}: {e}")
+
+    def _patch_shown_listing(self, name: str, new_name: str | None) -> None:
+        """Apply a rename (or, for None, a delete) to the rows on screen"""
+        path = self.current_remote_path
+        if not self._shown_listing or self._shown_listing[0] != path:
+            self.refresh_remote_view(force=True)
+            return
+        shown = self._shown_listing[1]
+        if new_name is not None and any(item.name == new_name for item in shown):
+            # The rename replaced (or moved into) an entry on screen
+            self.refresh_remote_view(force=True)
+            return
+        items = [item for item in shown if item.name != name]
+        if new_name is None:
+            self.model.remove_entry(name)
+        else:
+            renamed = [_renamed(item, new_name) for item in shown if item.name == name]
+            if not renamed:
+                self.refresh_remote_view(force=True)
+                return
+            items.extend(renamed)
+            items.sort(key=_listing_order)
+            self.model.replace_entry(name, _display_rows(renamed)[0])
+        self._shown_listing = (path, items)
 
     def handle_download(self, path: str, is_dir: bool) -> None:
         """Handle download request"""
@@ -1287,21 +2818,32 @@ class UploaderWindow(QtWidgets.QMainWindow):
 
         downloads_path = Path.home() / "Downloads"
         downloads_path.mkdir(exist_ok=True)
-        dest_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Download to...", str(downloads_path / Path(path).name)
+        # Window-modal and opened with open(), so the event loop keeps running
+        dialog = QtWidgets.QFileDialog(
+            self, "Download to...", str(downloads_path / posixpath.basename(path))
         )
-        if not dest_path:
+        dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptSave)
+        dialog.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(
+            lambda dest_path: self._start_download(path, dest_path, is_dir)
+        )
+        dialog.open()
+
+    def _start_download(self, path: str, dest_path: str, is_dir: bool) -> None:
+        """Queue a download once a destination has been chosen"""
+        if not self.uploader or not dest_path:
             return
 
-        worker = DownloadWorker(self.uploader, path, dest_path, is_dir)
-        worker.progress.connect(self.log_box.appendPlainText)
-        worker.finished_.connect(
-            lambda success: self.log_box.appendPlainText(
+        task = DownloadRunnable(self.uploader, path, dest_path, is_dir)
+        task.signals.progress.connect(self.log)
+        task.signals.bytes_transferred.connect(self._on_transfer_progress)
+        task.signals.finished_.connect(self.transfer_bar.hide)
+        task.signals.finished_.connect(
+            lambda success: self.log(
                 "Download finished." if success else "Download failed."
             )
         )
-        self.workers.append(worker)
-        worker.start()
+        self.transfer_pool.start(task)
 
     def add_bookmark(self, path: str) -> None:
         host = self.host_combo.currentText()
@@ -1311,9 +2853,9 @@ class UploaderWindow(QtWidgets.QMainWindow):
             self.bookmarks[host] = []
         if path not in self.bookmarks[host]:
             self.bookmarks[host].append(path)
-            self._save_bookmarks()
+            self._save_timer.start()
             self._update_bookmark_list()
-            self.log_box.appendPlainText(f"Bookmark added: {path}")
+            self.log(f"Bookmark added: {path}")
 
     def navigate_to_bookmark(self, path: str) -> None:
         self.path_edit.setText(path)
@@ -1325,51 +2867,74 @@ class UploaderWindow(QtWidgets.QMainWindow):
             return
         if path in self.bookmarks[host]:
             self.bookmarks[host].remove(path)
-            self._save_bookmarks()
+            self._save_timer.start()
             self._update_bookmark_list()
-            self.log_box.appendPlainText(f"Bookmark removed: {path}")
+            self.log(f"Bookmark removed: {path}")
 
     def navigate_to_path(self) -> None:
-        path = self.path_edit.text()
+        # Typed paths may carry a trailing or doubled slash; the dirname/join
+        # calls elsewhere expect the canonical form
+        path = posixpath.normpath(self.path_edit.text() or "/")
         if path != self.current_remote_path:
             self.current_remote_path = path
             self.refresh_remote_view()
             self._sync_folder_view(path)
 
     def _sync_folder_view(self, path_to_sync: str) -> None:
-        """Expand the folder view to the specified path."""
-        if not path_to_sync or path_to_sync == "/":
+        """Expand the folder view to the specified path.
+
+        Listings for every ancestor are fetched with one batched SSH call; the
+        tree is then filled and expanded top-down from the result.
+        """
+        if not path_to_sync or path_to_sync == "/" or not self.remote_fs:
             return
 
-        parts = Path(path_to_sync).parts
-        current_path_str = "/"
-        parent_item = self.folder_model.invisibleRootItem()
+        parts = [part for part in path_to_sync.split("/") if part]
+        ancestors = ["/"] + ["/" + "/".join(parts[: i + 1]) for i in range(len(parts))]
+
+        listings: dict[str, list[FileSystemItem]] = {}
+        for folder in ancestors:
+            items = self.remote_fs.fresh_listing(folder)
+            if items is not None:
+                listings[folder] = items
+        if len(listings) == len(ancestors):
+            # Every folder on the way is warm; expand without a round-trip
+            self._expand_folder_chain(ancestors, listings)
+            return
 
-        for i, part in enumerate(parts):
-            if i == 0:  # Skip root "/"
-                continue
+        worker = RemoteBatchListWorker(self.remote_fs, ancestors)
+        worker.signals.completed.connect(
+            lambda listings: self._expand_folder_chain(ancestors, listings)
+        )
+        worker.signals.failed.connect(self._on_list_failed)
+        self.list_pool.start(worker)
+
+    def _expand_folder_chain(
+        self, ancestors: list[str], listings: dict[str, list[FileSystemItem]]
+    ) -> None:
+        """Populate and expand each folder along `ancestors`, starting at root
 
-            current_path_str = str(Path(current_path_str) / part)
-            found_item = None
-            for row in range(parent_item.rowCount()):
-                child_item = parent_item.child(row)
-                if child_item and child_item.data(PathRole) == current_path_str:
-                    found_item = child_item
+        The tree repaints once for the whole chain rather than once per level.
+        """
+        self.folder_tree.setUpdatesEnabled(False)
+        try:
+            for folder in ancestors:
+                item = self._folder_items.get(folder)
+                if item is None:
+                    # Not in the tree (or parent still loading); stop here
                     break
 
-            if found_item:
-                index = self.folder_model.indexFromItem(found_item)
+                if not item.data(LoadedRole) and folder in listings:
+                    self._populate_folder_item(item, folder, listings[folder])
+                index = self.folder_model.indexFromItem(item)
                 if not self.folder_tree.isExpanded(index):
                     self.folder_tree.expand(index)
-                parent_item = found_item
-            else:
-                # If a part of the path is not found, stop.
-                # This can happen if the directory is not yet loaded.
-                break
+        finally:
+            self.folder_tree.setUpdatesEnabled(True)
 
     def go_up_directory(self) -> None:
         """Go up to the parent directory"""
-        new_path = str(Path(self.current_remote_path).parent)
+        new_path = posixpath.dirname(self.current_remote_path)
         if new_path != self.current_remote_path:
             self.current_remote_path = new_path
             self.path_edit.setText(self.current_remote_path)
@@ -1379,96 +2944,108 @@ class UploaderWindow(QtWidgets.QMainWindow):
     def refresh_remote_view(self, force: bool = False) -> None:
         if not self.remote_fs:
             return
+        path = self.current_remote_path
         if force:
-            self.remote_fs.clear_cache(self.current_remote_path)
-
-        self.status_label.setText("Loading...")
-        self.model.removeRows(0, self.model.rowCount())
+            self.remote_fs.clear_cache(path)
+        elif path in self._in_flight_lists:
+            # That listing will land in the view; don't fetch it twice
+            return
 
-        worker = RemoteListWorker(self.remote_fs, self.current_remote_path)
-        worker.completed.connect(self._on_list_completed)
-        worker.failed.connect(self._on_list_failed)
-        self.workers.append(worker)
-        worker.start()
+        fresh = None if force else self.remote_fs.fresh_listing(path)
+        if fresh is not None:
+            # Within the TTL: nothing to revalidate, so no worker at all
+            self._on_list_completed(path, fresh)
+            return
 
-    def _on_list_completed(self, path: str, items: list[FileSystemItem]) -> None:
+        cached = None if force else self.remote_fs.peek_listing(path)
+        if cached is not None:
+            # Show the last known listing now; the fetch below revalidates it
+            self._on_list_completed(path, cached)
+        else:
+            self.status_label.setText("Loading...")
+            self.model.clear()
+            self._shown_listing = None
+
+        remote_fs = self.remote_fs
+
+        # A listing from the previous host must not land in the new one's view
+        def on_complete(
+            p: str, items: list[FileSystemItem], rows: list[DisplayRow]
+        ) -> None:
+            if self.remote_fs is remote_fs:
+                self._on_list_completed(p, items, rows)
+
+        def on_failed(error: str) -> None:
+            if self.remote_fs is remote_fs:
+                self._on_list_failed(error, path)
+
+        worker = RemoteListWorker(remote_fs, path, display=True)
+        worker.signals.completed.connect(on_complete)
+        worker.signals.failed.connect(on_failed)
+        self._in_flight_lists.add(path)
+        self.list_pool.start(worker)
+
+    def _on_list_completed(
+        self,
+        path: str,
+        items: list[FileSystemItem],
+        display_rows: list[DisplayRow] | None = None,
+    ) -> None:
+        self._in_flight_lists.discard(path)
         if path != self.current_remote_path:
             return
+        if self._shown_listing == (path, items):
+            # Revalidation found nothing new; keep the rows (and selection)
+            self.status_label.setText("")
+            return
 
-        self.model.removeRows(0, self.model.rowCount())
-
-        # Disable sorting temporarily to ensure ".." stays first
-        self.tree.setSortingEnabled(False)
-
-        if Path(path).parent != Path(path):
-            parent_item = QtGui.QStandardItem("..")
-            parent_item.setData("parent", TypeRole)
-            # Make the ".." item not sortable by prefixing with a character that sorts first
-            parent_item.setData(" ..", QtCore.Qt.ItemDataRole.DisplayRole)
-            self.model.appendRow(
-                [parent_item, QtGui.QStandardItem(""), QtGui.QStandardItem("")]
-            )
-
-        for item in items:
-            try:
-                name_item = QtGui.QStandardItem(item["display_name"])
-                name_item.setData(item["name"], PathRole)
-                name_item.setData(
-                    "folder"
-                    if item["is_dir"]
-                    else "link"
-                    if item["is_link"]
-                    else "file",
-                    TypeRole,
-                )
-                name_item.setToolTip(item["display_name"])
-
-                icon_provider = QtWidgets.QFileIconProvider()
-                icon = (
-                    icon_provider.icon(QtWidgets.QFileIconProvider.IconType.Folder)
-                    if item["is_dir"]
-                    else self.style().standardIcon(
-                        QtWidgets.QStyle.StandardPixmap.SP_FileLinkIcon
-                    )
-                    if item["is_link"]
-                    else icon_provider.icon(QtWidgets.QFileIconProvider.IconType.File)
-                )
-                name_item.setIcon(icon)
-
-                mtime_item = QtGui.QStandardItem(format_mtime(item["mtime"]))
-                size_item = QtGui.QStandardItem(human_size(item["size"]))
-
-                self.model.appendRow([name_item, mtime_item, size_item])
-            except Exception as e:
-                self.log_box.appendPlainText(
-                    f"Error processing item {item.get('name', '')}: {e}"
-                )
-
-        # Re-enable sorting - the ".." will stay first due to the space prefix
-        self.tree.setSortingEnabled(True)
-        self.tree.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
+        if display_rows is None:
+            display_rows = _display_rows(items)
+        # One model reset for the whole listing, sorted as the header says
+        self.model.set_rows(display_rows, posixpath.dirname(path) != path)
 
         self.status_label.setText("")
         self.tree.set_current_path(path)
-        self.workers = [w for w in self.workers if not w.isFinished()]
+        self._shown_listing = (path, items)
+
+        # The next click is usually back up or into a subfolder; warm those
+        subdirs = [posixpath.join(path, item.name) for item in items if item.is_dir]
+        parent = posixpath.dirname(path)
+        nearby = subdirs[:_PREFETCH_SUBDIRS]
+        self._queue_prefetch([parent, *nearby] if parent != path else nearby)
 
-    def _on_list_failed(self, error: str) -> None:
+    def _on_list_failed(self, error: str, path: str | None = None) -> None:
         """Handle list failure"""
-        self.log_box.appendPlainText(f"Error listing directory: {error}")
+        if path is not None:
+            self._in_flight_lists.discard(path)
+        self.log(f"Error listing directory: {error}")
         self.status_label.setText("Error!")
-        self.workers = [w for w in self.workers if not w.isFinished()]
+
+    def _set_lan_mode(self, enabled: bool) -> None:
+        """Apply the LAN toggle to transfers started from now on"""
+        if self.uploader:
+            self.uploader.lan_mode = enabled
+        ssh_bin = _which("hpnssh")
+        if enabled and ssh_bin and not _none_cipher_options(ssh_bin):
+            self.log(f"⚠️ {ssh_bin} is not HPN-SSH; LAN transfers stay encrypted")
 
     def on_host_changed(self, host: str) -> None:
         """Handle host change"""
         if self._initializing_hosts:
             return
-        self.model.removeRows(0, self.model.rowCount())
+        self.model.clear()
+        self._shown_listing = None
         self.folder_model.removeRows(0, self.folder_model.rowCount())
+        self._folder_items.clear()
+        # Listings still running belong to the old host and are ignored
+        self._in_flight_lists.clear()
+        self._in_flight_folders.clear()
+        self._log_buffer.clear()
         self.log_box.clear()
         try:
             self.connect_to_host()
         except Exception as e:
-            self.log_box.appendPlainText(f"Failed to connect to {host}: {e}")
+            self.log(f"Failed to connect to {host}: {e}")
 
     def on_tree_double_click(self, index: QtCore.QModelIndex) -> None:
         """Handle double click on a remote item"""
@@ -1478,7 +3055,7 @@ class UploaderWindow(QtWidgets.QMainWindow):
                 name = index.data(PathRole) or index.data(
                     QtCore.Qt.ItemDataRole.DisplayRole
                 )
-                new_path = str(Path(self.current_remote_path) / name)
+                new_path = posixpath.join(self.current_remote_path, name)
                 self.current_remote_path = new_path
                 self.path_edit.setText(self.current_remote_path)
                 self.refresh_remote_view()
@@ -1486,7 +3063,7 @@ class UploaderWindow(QtWidgets.QMainWindow):
             elif item_type == "parent":
                 self.go_up_directory()
         except Exception as e:
-            self.log_box.appendPlainText(f"Error navigating: {e}")
+            self.log(f"Error navigating: {e}")
 
     def _build_palette(self) -> None:
         palette = QtGui.QPalette()
@@ -1536,7 +3113,8 @@ class UploaderWindow(QtWidgets.QMainWindow):
         folder_layout = QtWidgets.QVBoxLayout(folder_widget)
         folder_layout.setContentsMargins(0, 0, 6, 0)
         folder_layout.setSpacing(0)
-        self.folder_model = QtGui.QStandardItemModel(0, 1)
+        self.folder_model = LazyFolderModel(0, 1)
+        self.folder_model.fetchRequested.connect(self.on_folder_fetch)
         self.folder_tree = FolderTreeView()
         self.folder_tree.setModel(self.folder_model)
         self.folder_tree.expanded.connect(self.on_folder_expanded)
@@ -1612,13 +3190,26 @@ class UploaderWindow(QtWidgets.QMainWindow):
         self.host_combo.setFixedWidth(220)
         self.host_combo.currentTextChanged.connect(self.on_host_changed)
         path_bar.addWidget(self.host_combo)
+        # Concurrent transfers; each one is its own rsync over the shared master
+        self.parallel_spin = QtWidgets.QSpinBox()
+        self.parallel_spin.setRange(1, 16)
+        self.parallel_spin.setValue(self.transfer_pool.maxThreadCount())
+        self.parallel_spin.setPrefix("×")
+        self.parallel_spin.setToolTip("Transfers to run at once")
+        self.parallel_spin.valueChanged.connect(self.transfer_pool.setMaxThreadCount)
+        path_bar.addWidget(self.parallel_spin)
+        self.lan_check = QtWidgets.QCheckBox("LAN")
+        self.lan_check.setToolTip(
+            "Fast LAN mode: send files whole and, with HPN-SSH, skip bulk encryption"
+        )
+        self.lan_check.toggled.connect(self._set_lan_mode)
+        path_bar.addWidget(self.lan_check)
         self.status_label = QtWidgets.QLabel("")
         self.status_label.setObjectName("muted")
         path_bar.addWidget(self.status_label)
         main_layout.addLayout(path_bar)
 
-        self.model = QtGui.QStandardItemModel(0, 3)
-        self.model.setHorizontalHeaderLabels(["Name", "Modified", "Size"])
+        self.model = RemoteDirModel(self._kind_icons, self)
 
         self.tree = RemoteTreeView()
         self.tree.setModel(self.model)
@@ -1647,8 +3238,15 @@ class UploaderWindow(QtWidgets.QMainWindow):
 
         self.log_box = QtWidgets.QPlainTextEdit()
         self.log_box.setReadOnly(True)
+        # Long transfers would otherwise grow the document without bound
+        self.log_box.setMaximumBlockCount(1000)
         self.log_box.setFixedHeight(140)
         main_layout.addWidget(self.log_box)
+
+        self.transfer_bar = QtWidgets.QProgressBar()
+        self.transfer_bar.setRange(0, 100)
+        self.transfer_bar.hide()
+        main_layout.addWidget(self.transfer_bar)
         main_layout.setStretch(1, 1)
         main_layout.setStretch(2, 0)
 
@@ -1662,8 +3260,6 @@ class UploaderWindow(QtWidgets.QMainWindow):
 
 
 if __name__ == "__main__":
-    import sys
-
     app = QtWidgets.QApplication(sys.argv)
     window = UploaderWindow()
     window.show()